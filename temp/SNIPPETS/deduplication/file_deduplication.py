@@ -17,6 +17,8 @@ Dependencies:
 
 Notes:
 - SHA-256 hashing for content comparison
+- Same-size candidates are hashed two at a time on separate threads (hashlib
+  releases the GIL on large updates, so both streams run concurrently)
 - Image deduplication uses size + resolution (faster than pixel comparison)
 - Text similarity uses weighted combination of line, paragraph, and word overlap
 - Default similarity threshold: 0.7 (adjustable)
@@ -36,6 +38,7 @@ import logging
 import os
 import re
 import difflib
+import threading
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
@@ -80,6 +83,38 @@ def get_file_hash(file_path: Path, block_size: int = 65536) -> Optional[str]:
         return None
 
 
+def _hash_pair(
+    file1: Path,
+    file2: Path,
+    block_size: int = 65536
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Calculate SHA-256 hashes of two files concurrently.
+
+    The second file is hashed on a worker thread while the first is hashed
+    in the calling thread. hashlib drops the GIL for large updates, so the
+    two digests are computed in parallel rather than back to back.
+
+    Args:
+        file1: First file path
+        file2: Second file path
+        block_size: Read block size (default 64KB)
+
+    Returns:
+        Tuple of (hash1, hash2), either of which may be None on error
+    """
+    second: List[Optional[str]] = [None]
+
+    def _worker() -> None:
+        second[0] = get_file_hash(file2, block_size)
+
+    worker = threading.Thread(target=_worker, daemon=True)
+    worker.start()
+    first = get_file_hash(file1, block_size)
+    worker.join()
+    return first, second[0]
+
+
 def get_image_info(file_path: Path) -> Tuple[Optional[int], Optional[Tuple[int, int]]]:
     """
     Get file size and resolution for an image.
@@ -181,10 +216,21 @@ def detect_duplicates(
                     duplicate_groups[key] = paths
 
         # Process non-image files using hash
-        if other_files:
+        if len(other_files) > 1:
+            # Hash candidates in pairs so two streams run at once; an odd
+            # file out falls back to the scalar hash.
+            hashed: List[Tuple[Path, Optional[str]]] = []
+            for i in range(0, len(other_files) - 1, 2):
+                file1, file2 = other_files[i], other_files[i + 1]
+                hash1, hash2 = _hash_pair(file1, file2)
+                hashed.append((file1, hash1))
+                hashed.append((file2, hash2))
+            if len(other_files) % 2:
+                last = other_files[-1]
+                hashed.append((last, get_file_hash(last)))
+
             hash_dict: Dict[str, List[Path]] = {}
-            for file_path in other_files:
-                file_hash = get_file_hash(file_path)
+            for file_path, file_hash in hashed:
                 if file_hash:
                     key = f"{size}_{file_hash}"
                     hash_dict.setdefault(key, []).append(file_path)
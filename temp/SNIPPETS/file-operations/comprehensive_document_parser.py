@@ -27,11 +27,18 @@ Supported Categories:
 Dependencies:
 - Core: pathlib, re, csv, json (standard library)
 - Optional: pdfminer.six, python-docx, openpyxl, xlrd, beautifulsoup4, pypandoc
+- Optional (faster): python-calamine (Rust-backed XLSX reader, preferred over openpyxl)
+- Optional (faster): orjson (JSON parse/serialize, preferred over json)
+- Optional (faster): selectolax (Lexbor HTML parser, preferred over beautifulsoup4)
+- Optional: charset-normalizer (encoding detection for non-UTF-8 text)
+- Optional (faster): polars (native CSV reader, used for CSVs over 1 MB)
 
 Notes:
 - Graceful fallback when optional dependencies unavailable
 - Memory-efficient processing for large files
 - Encoding detection for text files
+- With orjson, pretty-printed JSON writes some floats differently from the
+  stdlib (1e-7 vs 1e-07); parsed values are identical
 - Archive inspection and text extraction
 - Comprehensive error messages with suggestions
 
@@ -45,30 +52,57 @@ Source Attribution:
 - Author: Luke Steuber
 """
 
+import codecs
+import io
 import os
 import re
 import json
 import csv
+import functools
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Union
 
 # Optional imports with runtime checks
 try:
+    from pdfminer.converter import TextConverter
     from pdfminer.high_level import extract_text as pdf_extract_text
-    from pdfminer.pdfparser import PDFSyntaxError
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser, PDFSyntaxError
+    from pdfminer.pdftypes import resolve1
     PDF_AVAILABLE = True
 except ImportError:
+    TextConverter = None
     pdf_extract_text = None
+    LAParams = None
+    PDFDocument = None
+    PDFPageInterpreter = None
+    PDFResourceManager = None
+    PDFPage = None
+    PDFParser = None
     PDFSyntaxError = None
+    resolve1 = None
     PDF_AVAILABLE = False
 
 try:
     from docx import Document
+    from docx.oxml.ns import qn
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
     DOCX_AVAILABLE = True
 except ImportError:
     Document = None
+    qn = None
+    Table = None
+    Paragraph = None
     DOCX_AVAILABLE = False
 
 try:
@@ -78,6 +112,13 @@ except ImportError:
     load_workbook = None
     EXCEL_AVAILABLE = False
 
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CalamineWorkbook = None
+    CALAMINE_AVAILABLE = False
+
 try:
     from bs4 import BeautifulSoup
     HTML_AVAILABLE = True
@@ -85,6 +126,34 @@ except ImportError:
     BeautifulSoup = None
     HTML_AVAILABLE = False
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    pl = None
+    POLARS_AVAILABLE = False
+
+try:
+    from charset_normalizer import from_bytes as detect_charset
+    CHARSET_AVAILABLE = True
+except ImportError:
+    detect_charset = None
+    CHARSET_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -133,6 +202,308 @@ SPREADSHEET_EXTENSIONS: Set[str] = {
     '.xlsx', '.xls', '.xlsm', '.csv', '.tsv'
 }
 
+# Precomputed unions so hot paths do a single hash lookup
+_SUPPORTED_EXTS: FrozenSet[str] = frozenset(
+    TEXT_EXTENSIONS | CODE_EXTENSIONS | DOCUMENT_EXTENSIONS | SPREADSHEET_EXTENSIONS
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_ext_supported(ext: str) -> bool:
+    """Cached membership test keyed by lowercased suffix."""
+    return ext in _SUPPORTED_EXTS
+
+
+# Extension -> FileParser method name, built from the libraries that loaded;
+# anything else is parsed as text
+_EXT_DISPATCH: Dict[str, str] = {
+    '.csv': '_parse_csv',
+    '.json': '_parse_json',
+    '.jsonl': '_parse_json',
+    '.html': '_parse_html',
+    '.htm': '_parse_html',
+}
+
+# Extension -> install hint for parsers whose dependency is missing
+_MISSING_DEPS: Dict[str, str] = {}
+
+if PDF_AVAILABLE:
+    _EXT_DISPATCH['.pdf'] = '_parse_pdf'
+else:
+    _MISSING_DEPS['.pdf'] = (
+        "PDF parsing requires pdfminer.six. "
+        "Install with: pip install pdfminer.six"
+    )
+
+for _ext in ('.docx', '.doc'):
+    if DOCX_AVAILABLE:
+        _EXT_DISPATCH[_ext] = '_parse_docx'
+    else:
+        _MISSING_DEPS[_ext] = (
+            "DOCX parsing requires python-docx. "
+            "Install with: pip install python-docx"
+        )
+
+for _ext in ('.xlsx', '.xls', '.xlsm'):
+    if CALAMINE_AVAILABLE or EXCEL_AVAILABLE:
+        _EXT_DISPATCH[_ext] = '_parse_excel'
+    else:
+        _MISSING_DEPS[_ext] = (
+            "XLSX parsing requires python-calamine or openpyxl. "
+            "Install with: pip install python-calamine"
+        )
+
+del _ext
+
+
+# ============================================================================
+# Precompiled Patterns
+# ============================================================================
+
+_WS_RE = re.compile(r'[ \t]+')
+_CTRL_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+_BLANKLINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_CR_TO_LF = {0x0D: 0x0A}
+
+# Matches anything _clean_text would rewrite apart from the final strip();
+# text without a match only needs strip()
+_NEEDS_CLEAN_RE = re.compile(r'[\x00-\x09\x0B-\x1F\x7F]| {2}|\n\s*\n\s*\n')
+
+# Control characters except tab/newline/CR, deleted via str.translate
+_CTRL_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in [*range(0, 9), 11, 12, *range(14, 32), 127]
+))
+
+# HTML fallback runs on raw bytes and decodes once at the end
+_B_SCRIPT_RE = re.compile(rb'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_B_STYLE_RE = re.compile(rb'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_B_TAG_RE = re.compile(rb'<[^>]+>')
+_B_WS_RE = re.compile(rb'\s+')
+
+
+# ============================================================================
+# CSV Delimiter Detection
+# ============================================================================
+
+_CSV_SAMPLE_SIZE = 65536
+_CSV_SAMPLE_LINES = 32
+_CSV_DELIMITERS = (',', ';', '\t', '|')
+_CSV_MAX_ROWS = 10000
+_CSV_POLARS_MIN_SIZE = 1024 * 1024
+
+
+def _detect_delimiter(sample: str) -> str:
+    """
+    Pick the CSV delimiter whose per-line count is most consistent.
+
+    Counts each candidate outside double-quoted regions on the first lines
+    of the sample and returns the one with the lowest variance. Ties go to
+    the earlier candidate in ``_CSV_DELIMITERS``; defaults to ``','``.
+
+    Args:
+        sample: Leading text of the CSV file
+
+    Returns:
+        Single-character delimiter
+    """
+    lines = [
+        ''.join(line.split('"')[::2])
+        for line in sample.splitlines()[:_CSV_SAMPLE_LINES]
+        if line.strip()
+    ]
+    if not lines:
+        return ','
+
+    best = ','
+    best_variance = None
+    for delimiter in _CSV_DELIMITERS:
+        counts = [line.count(delimiter) for line in lines]
+        total = sum(counts)
+        if total == 0:
+            continue
+        mean = total / len(counts)
+        variance = sum((c - mean) ** 2 for c in counts) / len(counts)
+        if best_variance is None or variance < best_variance:
+            best, best_variance = delimiter, variance
+
+    return best
+
+
+# ============================================================================
+# Encoding Detection
+# ============================================================================
+
+_ENCODING_SAMPLE_SIZE = 65536
+
+# Below this many non-ASCII bytes in the sample, charset detection is mostly
+# guesswork (a lone 'é' reads as UTF-16 or Mac Latin 2), so cp1252 is assumed
+_ENCODING_MIN_EVIDENCE = 16
+_ASCII_BYTES = bytes(range(128))
+
+
+def _decode_text(raw: bytes) -> tuple[str, str]:
+    """
+    Decode file bytes, detecting the encoding in a single pass.
+
+    Tries strict UTF-8 first (the common case), honouring a UTF-8 BOM. When
+    that fails, text that was valid multi-byte UTF-8 up to the bad byte is
+    treated as damaged UTF-8. Otherwise the encoding is sniffed with
+    charset-normalizer from a window around the first undecodable byte, so
+    a long ASCII header can't hide it. cp1252 wins ties with the detected
+    encoding, and is the fallback without charset-normalizer or enough
+    non-ASCII evidence. Undecodable bytes become U+FFFD, never dropped.
+
+    Args:
+        raw: Raw file contents
+
+    Returns:
+        Tuple of (decoded text, encoding name)
+    """
+    if raw.startswith(codecs.BOM_UTF8):
+        return raw[len(codecs.BOM_UTF8):].decode('utf-8', errors='replace'), 'utf-8-sig'
+
+    try:
+        return raw.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError as e:
+        bad = e.start
+
+    # Everything before the bad byte is valid UTF-8; if it already holds
+    # multi-byte sequences, this is UTF-8 with a few corrupt bytes
+    if not raw[:bad].isascii():
+        return raw.decode('utf-8', errors='replace'), 'utf-8'
+
+    encoding = 'cp1252'
+    if CHARSET_AVAILABLE:
+        lo = max(0, bad - _ENCODING_SAMPLE_SIZE // 2)
+        window = raw[lo:lo + _ENCODING_SAMPLE_SIZE]
+        non_ascii = len(window.translate(None, _ASCII_BYTES))
+        if non_ascii >= _ENCODING_MIN_EVIDENCE:
+            matches = detect_charset(window)
+            best = matches.best()
+            # Keep cp1252 when it scores the same as the winner (cp1250 and
+            # cp1252 often tie on Western text)
+            if best is not None and best.encoding != 'ascii' and not any(
+                'cp1252' in m.could_be_from_charset
+                for m in matches
+                if (m.chaos, m.coherence) == (best.chaos, best.coherence)
+            ):
+                encoding = best.encoding
+
+    return raw.decode(encoding, errors='replace'), encoding
+
+
+# ============================================================================
+# PDF Helpers
+# ============================================================================
+
+# Minimum pages per worker before splitting a PDF across processes
+_PDF_PAGES_PER_WORKER = 16
+
+# Process pool shared by every large PDF, created on first use
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared PDF process pool, creating it on first use.
+
+    Workers are spawned rather than forked: parse_file usually runs inside
+    a thread pool, and forking a multi-threaded process can hand the child
+    locks that are held by threads which don't exist there.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _pdf_pool
+
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor):
+    """Drop a broken shared pool so the next large PDF starts a fresh one."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False)
+
+
+def _extract_pdf_pages(job: tuple[str, int, int]) -> str:
+    """Extract text for pages [start, end) of a PDF (process-pool worker)."""
+    path, start, end = job
+    return pdf_extract_text(
+        path,
+        page_numbers=range(start, end),
+        caching=True,
+        codec='utf-8'
+    )
+
+
+def _pdf_page_count(doc: 'PDFDocument') -> Optional[int]:
+    """Page count from the page tree root's /Count, without walking the pages."""
+    try:
+        count = resolve1(resolve1(doc.catalog['Pages'])['Count'])
+    except (KeyError, TypeError):
+        return None
+    return count if isinstance(count, int) and count >= 0 else None
+
+
+def _extract_pdf_document(doc: 'PDFDocument') -> tuple[str, int]:
+    """
+    Extract text from an open PDF in one pass, counting pages as they go.
+
+    Same converter and layout settings as pdfminer's extract_text().
+
+    Returns:
+        Tuple of (text, page count)
+    """
+    rsrcmgr = PDFResourceManager(caching=True)
+    output = io.StringIO()
+    device = TextConverter(rsrcmgr, output, codec='utf-8', laparams=LAParams())
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    pages = 0
+    try:
+        for page in PDFPage.create_pages(doc):
+            interpreter.process_page(page)
+            pages += 1
+    finally:
+        device.close()
+    return output.getvalue(), pages
+
+
+# ============================================================================
+# JSON Helpers
+# ============================================================================
+
+def _json_roundtrip(raw: bytes) -> tuple[Any, str]:
+    """
+    Decode JSON bytes and pretty-print them with a 2-space indent.
+
+    Uses orjson when available. Documents orjson rejects (NaN/Infinity
+    literals, oversized ints) go through the stdlib for both directions so
+    values are not silently rewritten.
+
+    The orjson text is not byte-identical to json.dumps(indent=2): values
+    and layout are the same, but floats use the shortest round-trip form
+    without exponent padding (1e-7, 1e100, 0.000025 rather than 1e-07,
+    1e+100, 2.5e-05).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.loads(raw)
+            content = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+            return data, content
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+
+    data = json.loads(raw)
+    return data, json.dumps(data, indent=2, ensure_ascii=False)
+
 
 # ============================================================================
 # File Parser Class
@@ -150,19 +521,18 @@ class FileParser:
         ...     print(f"Pages: {result.metadata.get('pages', 'N/A')}")
     """
 
+    _SUPPORTED_EXTS: FrozenSet[str] = _SUPPORTED_EXTS
+
     @classmethod
-    def get_supported_extensions(cls) -> Set[str]:
+    def get_supported_extensions(cls) -> FrozenSet[str]:
         """Get all supported file extensions."""
-        return (
-            TEXT_EXTENSIONS | CODE_EXTENSIONS |
-            DOCUMENT_EXTENSIONS | SPREADSHEET_EXTENSIONS
-        )
+        return cls._SUPPORTED_EXTS
 
     @classmethod
     def is_supported(cls, file_path: Union[str, Path]) -> bool:
         """Check if file type is supported."""
-        ext = Path(file_path).suffix.lower()
-        return ext in cls.get_supported_extensions()
+        ext = os.path.splitext(os.fspath(file_path))[1].lower()
+        return _is_ext_supported(ext)
 
     def parse_file(self, file_path: Union[str, Path]) -> ParseResult:
         """
@@ -179,46 +549,40 @@ class FileParser:
             >>> result = parser.parse_file("data.csv")
             >>> print(f"Rows: {result.metadata['rows']}")
         """
-        file_path = Path(file_path)
+        # Plain string paths with os.path keep pathlib off the hot path
+        file_path = os.fspath(file_path)
 
-        if not file_path.exists():
+        # One stat call covers both the existence check and the size
+        try:
+            file_size = os.stat(file_path).st_size
+        except (FileNotFoundError, NotADirectoryError):
             return ParseResult(
                 content='',
-                metadata={'file_path': str(file_path)},
+                metadata={'file_path': file_path},
                 success=False,
                 error=f"File not found: {file_path}"
             )
 
+        file_name = os.path.basename(file_path)
+        ext = os.path.splitext(file_name)[1].lower()
+
         # Initialize metadata
         metadata = {
-            'file_path': str(file_path),
-            'file_name': file_path.name,
-            'file_size': file_path.stat().st_size,
-            'extension': file_path.suffix.lower(),
+            'file_path': file_path,
+            'file_name': file_name,
+            'file_size': file_size,
+            'extension': ext,
             'encoding': 'utf-8'
         }
 
         try:
-            ext = file_path.suffix.lower()
-
-            # Route to appropriate parser
-            if ext == '.pdf':
-                content, extra_meta = self._parse_pdf(file_path)
-            elif ext in {'.docx', '.doc'}:
-                content, extra_meta = self._parse_docx(file_path)
-            elif ext in {'.xlsx', '.xls', '.xlsm'}:
-                content, extra_meta = self._parse_excel(file_path)
-            elif ext == '.csv':
-                content, extra_meta = self._parse_csv(file_path)
-            elif ext in {'.json', '.jsonl'}:
-                content, extra_meta = self._parse_json(file_path)
-            elif ext in {'.html', '.htm'}:
-                content, extra_meta = self._parse_html(file_path)
-            elif ext in TEXT_EXTENSIONS | CODE_EXTENSIONS:
-                content, extra_meta = self._parse_text(file_path)
-            else:
-                # Try as text file
-                content, extra_meta = self._parse_text(file_path)
+            # Route to appropriate parser (unknown types are tried as text)
+            method_name = _EXT_DISPATCH.get(ext)
+            if method_name is None:
+                if ext in _MISSING_DEPS:
+                    raise ImportError(_MISSING_DEPS[ext])
+                method_name = '_parse_text'
+            content, extra_meta = getattr(self, method_name)(file_path)
 
             metadata.update(extra_meta)
 
@@ -241,152 +605,270 @@ class FileParser:
     # Format-Specific Parsers
     # ========================================================================
 
-    def _parse_pdf(self, file_path: Path) -> tuple[str, dict]:
+    def _parse_pdf(self, file_path: str) -> tuple[str, dict]:
         """Parse PDF files using pdfminer."""
-        if not PDF_AVAILABLE:
-            raise ImportError(
-                "PDF parsing requires pdfminer.six. "
-                "Install with: pip install pdfminer.six"
-            )
-
         try:
-            content = pdf_extract_text(
-                str(file_path),
-                maxpages=0,
-                caching=True,
-                codec='utf-8'
-            )
+            with open(file_path, 'rb') as f:
+                doc = PDFDocument(PDFParser(f))
+                page_count = _pdf_page_count(doc) or 0
+
+                # pdfminer is pure Python and holds the GIL, so large documents
+                # are split into contiguous page ranges across the shared pool.
+                # Inside a worker process (parse_files(use_processes=True))
+                # the CPUs are already busy, so pages are parsed in-process
+                # rather than starting cpu_count more interpreters per worker.
+                workers = 0
+                if multiprocessing.parent_process() is None:
+                    workers = min(os.cpu_count() or 1, page_count // _PDF_PAGES_PER_WORKER)
+                content = None
+                if workers > 1:
+                    chunk = -(-page_count // workers)
+                    jobs = [
+                        (file_path, start, min(start + chunk, page_count))
+                        for start in range(0, page_count, chunk)
+                    ]
+                    pool = _get_pdf_pool()
+                    try:
+                        content = ''.join(pool.map(_extract_pdf_pages, jobs))
+                    except BrokenProcessPool:
+                        logger.warning("PDF worker pool died; parsing %s in-process", file_path)
+                        _discard_pdf_pool(pool)
+
+                # Small documents (or no usable /Count) are extracted from the
+                # already-open document, counting pages in the same pass
+                if content is None:
+                    content, page_count = _extract_pdf_document(doc)
 
             content = self._clean_text(content)
 
             if not content or len(content.strip()) < 10:
                 raise ValueError("PDF appears empty or contains only images")
 
-            return content, {'pages': content.count('\f') + 1}
+            return content, {'pages': page_count}
 
         except PDFSyntaxError:
             raise ValueError("PDF file corrupted or invalid")
 
-    def _parse_docx(self, file_path: Path) -> tuple[str, dict]:
+    def _parse_docx(self, file_path: str) -> tuple[str, dict]:
         """Parse DOCX files using python-docx."""
-        if not DOCX_AVAILABLE:
-            raise ImportError(
-                "DOCX parsing requires python-docx. "
-                "Install with: pip install python-docx"
-            )
-
-        doc = Document(str(file_path))
-
-        # Extract paragraphs
-        paragraphs = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-
-        # Extract tables
-        tables_text = []
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = ' | '.join(cell.text.strip() for cell in row.cells)
-                if row_text.strip():
-                    tables_text.append(row_text)
+        doc = Document(file_path)
+
+        # One pass over the body in document order instead of separate
+        # doc.paragraphs / doc.tables traversals
+        w_p, w_tbl = qn('w:p'), qn('w:tbl')
+        paragraphs = io.StringIO()
+        tables = io.StringIO()
+        paragraph_count = 0
+        table_count = 0
+        table_rows = 0
+
+        for element in doc.element.body.iterchildren():
+            if element.tag == w_p:
+                text = Paragraph(element, doc).text.strip()
+                if text:
+                    if paragraph_count:
+                        paragraphs.write('\n')
+                    paragraphs.write(text)
+                    paragraph_count += 1
+            elif element.tag == w_tbl:
+                table_count += 1
+                for row in Table(element, doc).rows:
+                    row_text = ' | '.join(cell.text.strip() for cell in row.cells)
+                    if row_text.strip():
+                        tables.write('\n')
+                        tables.write(row_text)
+                        table_rows += 1
 
         # Combine
-        content_parts = paragraphs
-        if tables_text:
-            content_parts.extend(['', '--- Tables ---'] + tables_text)
-
-        content = '\n'.join(content_parts)
+        content = paragraphs.getvalue()
+        if table_rows:
+            content += ('\n' if paragraph_count else '') + '\n--- Tables ---' + tables.getvalue()
 
         return content, {
-            'paragraphs': len(paragraphs),
-            'tables': len(doc.tables)
+            'paragraphs': paragraph_count,
+            'tables': table_count
         }
 
-    def _parse_excel(self, file_path: Path) -> tuple[str, dict]:
-        """Parse XLSX files using openpyxl."""
-        if not EXCEL_AVAILABLE:
-            raise ImportError(
-                "XLSX parsing requires openpyxl. "
-                "Install with: pip install openpyxl"
+    def _parse_excel(self, file_path: str) -> tuple[str, dict]:
+        """Parse XLSX files using python-calamine, falling back to openpyxl."""
+        if CALAMINE_AVAILABLE:
+            # Rust-backed reader returns plain Python values per row without
+            # building a cell object for every cell.
+            workbook = CalamineWorkbook.from_path(file_path)
+            sheet_names = list(workbook.sheet_names)
+            sheets = (
+                (name, workbook.get_sheet_by_name(name).to_python(skip_empty_area=True))
+                for name in sheet_names
             )
+        else:
+            workbook = load_workbook(
+                file_path,
+                read_only=True,
+                data_only=True,
+                keep_links=False,
+                keep_vba=False
+            )
+            sheet_names = list(workbook.sheetnames)
+            sheets = ((name, workbook[name].values) for name in sheet_names)
 
-        workbook = load_workbook(str(file_path), read_only=True, data_only=True)
-
-        sheets_content = []
+        # Single pass: rows are written straight into one buffer, and a
+        # sheet header is only emitted once the sheet yields a non-empty row
+        buf = io.StringIO()
+        write = buf.write
         total_rows = 0
 
-        for sheet_name in workbook.sheetnames:
-            worksheet = workbook[sheet_name]
-            sheet_content = [f"=== Sheet: {sheet_name} ==="]
-            sheet_rows = 0
-
-            for row in worksheet.iter_rows(values_only=True):
-                if any(cell is not None for cell in row):
-                    row_text = ' | '.join(str(cell) if cell is not None else '' for cell in row)
-                    if row_text.strip():
-                        sheet_content.append(row_text)
-                        sheet_rows += 1
-
-            if sheet_rows > 0:
-                sheets_content.extend(sheet_content + [''])
-                total_rows += sheet_rows
-
-        workbook.close()
-
-        return '\n'.join(sheets_content), {
-            'sheets': len(workbook.sheetnames),
+        try:
+            for sheet_name, rows in sheets:
+                sheet_had_data = False
+
+                for row in rows:
+                    if any(cell is not None and cell != '' for cell in row):
+                        row_text = ' | '.join('' if cell is None else str(cell) for cell in row)
+                        if row_text.strip():
+                            if not sheet_had_data:
+                                write(f"=== Sheet: {sheet_name} ===\n")
+                                sheet_had_data = True
+                            write(row_text)
+                            write('\n')
+                            total_rows += 1
+
+                if sheet_had_data:
+                    write('\n')
+        finally:
+            workbook.close()
+
+        # Drop the separator after the last sheet
+        return buf.getvalue()[:-1], {
+            'sheets': len(sheet_names),
             'total_rows': total_rows
         }
 
-    def _parse_csv(self, file_path: Path) -> tuple[str, dict]:
+    def _parse_csv(self, file_path: str) -> tuple[str, dict]:
         """Parse CSV files with automatic delimiter detection."""
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Detect dialect
-            sample = f.read(8192)
-            f.seek(0)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+            # Detect delimiter from a bounded sample
+            sample = f.read(_CSV_SAMPLE_SIZE)
+            delimiter = _detect_delimiter(sample)
+
+            # Large files go through polars' native reader; small files stay
+            # on the stdlib where its fixed overhead would dominate
+            if POLARS_AVAILABLE and os.path.getsize(file_path) > _CSV_POLARS_MIN_SIZE:
+                header = next(csv.reader(io.StringIO(sample), delimiter=delimiter), [])
+                try:
+                    return self._parse_csv_polars(file_path, delimiter, header)
+                except Exception as e:
+                    logger.debug(f"polars CSV read failed for {file_path}, using csv: {e}")
 
-            try:
-                dialect = csv.Sniffer().sniff(sample)
-                reader = csv.reader(f, dialect)
-            except csv.Error:
-                f.seek(0)
-                reader = csv.reader(f)
+            f.seek(0)
+            reader = csv.reader(f, delimiter=delimiter)
 
-            rows = []
+            # Write rows straight into one buffer instead of a list of lines
+            buf = io.StringIO()
+            write = buf.write
+            line_count = 0
             for row_num, row in enumerate(reader):
                 if row_num == 0:
-                    rows.append(' | '.join(f"**{cell}**" for cell in row))
+                    write(' | '.join(f"**{cell}**" for cell in row))
                 else:
-                    rows.append(' | '.join(row))
+                    write('\n')
+                    write(' | '.join(row))
+                line_count += 1
 
-                if row_num > 10000:
-                    rows.append(f"... (truncated after {row_num} rows)")
+                if row_num > _CSV_MAX_ROWS:
+                    write(f"\n... (truncated after {row_num} rows)")
+                    line_count += 1
                     break
 
-            return '\n'.join(rows), {'rows': len(rows) - 1}
+            return buf.getvalue(), {'rows': line_count - 1}
+
+    def _parse_csv_polars(
+        self,
+        file_path: str,
+        delimiter: str,
+        header: List[str]
+    ) -> tuple[str, dict]:
+        """
+        Parse a large CSV with polars, producing _parse_csv's output.
+
+        polars pads short rows, renames duplicate or blank headers and can't
+        tell a padded cell from an empty one, so any file where that could
+        change the output raises ValueError and the caller falls back to the
+        csv module: long rows and invalid UTF-8 (polars errors), a header
+        that differs from the csv module's, or any missing/empty cell.
+
+        Args:
+            file_path: CSV file path
+            delimiter: Field delimiter
+            header: First row as parsed by the csv module
+        """
+        # All columns as strings so cell text is reproduced verbatim
+        df = pl.read_csv(
+            file_path,
+            separator=delimiter,
+            has_header=True,
+            n_rows=_CSV_MAX_ROWS + 1,
+            infer_schema_length=0,
+            encoding='utf8'
+        )
+
+        if df.columns != header:
+            raise ValueError("polars renamed header columns")
+        if any(df.null_count().row(0)):
+            raise ValueError("short rows or empty cells")
+
+        buf = io.StringIO()
+        write = buf.write
+        write(' | '.join(f"**{col}**" for col in df.columns))
+        for row in df.iter_rows():
+            write('\n')
+            write(' | '.join(row))
+        line_count = df.height + 1
+
+        if df.height > _CSV_MAX_ROWS:
+            write(f"\n... (truncated after {df.height} rows)")
+            line_count += 1
 
-    def _parse_json(self, file_path: Path) -> tuple[str, dict]:
+        return buf.getvalue(), {'rows': line_count - 1}
+
+    def _parse_json(self, file_path: str) -> tuple[str, dict]:
         """Parse JSON files."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data, content = _json_roundtrip(f.read())
 
-        content = json.dumps(data, indent=2, ensure_ascii=False)
         return content, {'json_type': type(data).__name__}
 
-    def _parse_html(self, file_path: Path) -> tuple[str, dict]:
-        """Parse HTML files using BeautifulSoup or fallback."""
-        if not HTML_AVAILABLE:
-            return self._parse_html_fallback(file_path)
+    def _parse_html(self, file_path: str) -> tuple[str, dict]:
+        """Parse HTML files using selectolax, BeautifulSoup, or fallback."""
+        if SELECTOLAX_AVAILABLE:
+            # Native parser; handles encoding detection from raw bytes
+            with open(file_path, 'rb') as f:
+                tree = LexborHTMLParser(f.read())
 
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+            for node in tree.css('script, style'):
+                node.decompose()
 
-        soup = BeautifulSoup(content, 'html.parser')
+            root = tree.body or tree.root
+            text = root.text(separator='\n') if root is not None else ''
+            links = len(tree.css('a'))
+            images = len(tree.css('img'))
 
-        # Remove script and style
-        for script in soup(["script", "style"]):
-            script.decompose()
+        elif HTML_AVAILABLE:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+
+            soup = BeautifulSoup(content, 'html.parser')
 
-        # Extract content
-        text = soup.get_text()
+            # Remove script and style
+            for script in soup(["script", "style"]):
+                script.decompose()
+
+            # Extract content
+            text = soup.get_text()
+            links = len(soup.find_all('a'))
+            images = len(soup.find_all('img'))
+
+        else:
+            return self._parse_html_fallback(file_path)
 
         # Clean
         lines = (line.strip() for line in text.splitlines())
@@ -394,45 +876,40 @@ class FileParser:
         text = '\n'.join(chunk for chunk in chunks if chunk)
 
         return text, {
-            'links': len(soup.find_all('a')),
-            'images': len(soup.find_all('img'))
+            'links': links,
+            'images': images
         }
 
-    def _parse_html_fallback(self, file_path: Path) -> tuple[str, dict]:
+    def _parse_html_fallback(self, file_path: str) -> tuple[str, dict]:
         """Fallback HTML parsing using regex."""
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
 
         # Remove script and style
-        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
+        content = _B_SCRIPT_RE.sub(b'', content)
+        content = _B_STYLE_RE.sub(b'', content)
 
         # Remove tags
-        text = re.sub(r'<[^>]+>', ' ', content)
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _B_TAG_RE.sub(b' ', content)
+        text = _B_WS_RE.sub(b' ', text).strip()
 
-        return text, {'fallback_parser': True}
+        return text.decode('utf-8', errors='ignore'), {'fallback_parser': True}
 
-    def _parse_text(self, file_path: Path) -> tuple[str, dict]:
+    def _parse_text(self, file_path: str) -> tuple[str, dict]:
         """Parse text and code files with encoding detection."""
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                    content = f.read()
-
-                content = self._clean_text(content)
+        with open(file_path, 'rb') as f:
+            content, encoding = _decode_text(f.read())
 
-                return content, {
-                    'encoding': encoding,
-                    'lines': content.count('\n') + 1 if content else 0
-                }
-
-            except UnicodeDecodeError:
-                continue
+        # Most source files need no cleaning; skip the regex passes for them
+        if _NEEDS_CLEAN_RE.search(content):
+            content = self._clean_text(content)
+        else:
+            content = content.strip()
 
-        raise ValueError("Could not decode file with any supported encoding")
+        return content, {
+            'encoding': encoding,
+            'lines': content.count('\n') + 1 if content else 0
+        }
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
@@ -440,16 +917,16 @@ class FileParser:
             return ''
 
         # Remove excessive whitespace
-        text = re.sub(r'[ \t]+', ' ', text)
+        text = _WS_RE.sub(' ', text)
 
         # Remove control characters except newlines
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        text = text.translate(_CTRL_TABLE)
 
         # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        text = text.replace('\r\n', '\n').translate(_CR_TO_LF)
 
         # Remove excessive blank lines
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = _BLANKLINES_RE.sub('\n\n', text)
 
         return text.strip()
 
@@ -458,6 +935,17 @@ class FileParser:
 # Functional Interface
 # ============================================================================
 
+_default_parser: Optional[FileParser] = None
+
+
+def _get_default_parser() -> FileParser:
+    """Return the shared FileParser used by the functional interface."""
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = FileParser()
+    return _default_parser
+
+
 def parse_file(file_path: Union[str, Path]) -> ParseResult:
     """
     Parse any supported file and extract text content.
@@ -473,8 +961,36 @@ def parse_file(file_path: Union[str, Path]) -> ParseResult:
         >>> if result.success:
         ...     print(result.content[:200])
     """
-    parser = FileParser()
-    return parser.parse_file(file_path)
+    return _get_default_parser().parse_file(file_path)
+
+
+def parse_files(
+    file_paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False
+) -> List[ParseResult]:
+    """
+    Parse many files concurrently, preserving input order.
+
+    Threads suit I/O-bound batches (disk or network latency, C extensions
+    that release the GIL). pdfminer is mostly pure Python and holds the GIL,
+    so PDF-heavy batches should pass ``use_processes=True``.
+
+    Args:
+        file_paths: Paths to parse
+        max_workers: Pool size (defaults to the executor's own default)
+        use_processes: Use a process pool instead of a thread pool
+
+    Returns:
+        List of ParseResult in the same order as file_paths
+
+    Example:
+        >>> results = parse_files(["a.pdf", "b.csv"], use_processes=True)
+        >>> print(sum(r.success for r in results))
+    """
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        return list(executor.map(parse_file, file_paths))
 
 
 def is_supported_file(file_path: Union[str, Path]) -> bool:
@@ -528,3 +1044,8 @@ if __name__ == "__main__":
                 print(f"✓ {file}: {len(result.content)} chars")
             else:
                 print(f"✗ {file}: {result.error}")
+
+    # Example 4: Parse a batch concurrently
+    print("\n=== Example 4: Batch Parse ===")
+    for file, result in zip(test_files, parse_files(test_files)):
+        print(f"{'✓' if result.success else '✗'} {file}")
@@ -24,8 +24,10 @@ Notes:
 - Use importlib.util.spec_from_file_location for file-based imports
 - Handle ImportError and module initialization errors gracefully
 - Check for required attributes/functions before registering modules
-- Avoid importing __init__.py and __pycache__ files
+- Avoid importing __init__.py files; directories such as __pycache__ are skipped
 - Consider module naming conventions (e.g., prefix pattern like "swarm_*.py")
+- Loaded modules are cached by (path, mtime); unchanged files are not re-executed
+- A fresh __pycache__ .pyc is unmarshalled directly, skipping the loader's checks
 
 Related Snippets:
 - file-operations/path_handling_utils.py - Path utilities
@@ -38,31 +40,89 @@ Source Attribution:
 - Author: Luke Steuber
 """
 
+import fnmatch
+import marshal
+import mmap
+import os
+import re
 import sys
+import threading
+import weakref
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, partial
 from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# module_name -> (source path, source mtime, module) for load_module_from_file
+_MODULE_MTIME_CACHE: Dict[str, Tuple[str, float, ModuleType]] = {}
+
+# module_name -> lock held across the cache check, sys.modules insert and
+# exec, so concurrent loads of one name execute its top-level code once
+_LOAD_LOCKS: Dict[str, threading.RLock] = {}
+_LOAD_LOCKS_GUARD = threading.Lock()
+
+# module -> {(filter_prefix, exclude_private): functions} for get_module_functions
+_FUNC_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Below this many candidate files, thread pool overhead outweighs the gain
+_PARALLEL_LOAD_MIN_FILES = 4
+
+try:
+    from _imp import _fix_co_filename
+except ImportError:  # non-CPython
+    _fix_co_filename = None
+
+# Sentinel for attribute lookups where None is a legitimate value
+_MISSING = object()
+
+
+def _lookup_attr(module: Any, mod_vars: Dict[str, Any], name: str) -> Any:
+    """
+    Look up a module attribute, or _MISSING.
+
+    Reads the namespace dict first (no descriptors, no exceptions) and only
+    falls back to getattr for names it lacks, so module __getattr__ (PEP 562)
+    and class attributes still count.
+    """
+    value = mod_vars.get(name, _MISSING)
+    if value is _MISSING:
+        value = getattr(module, name, _MISSING)
+    return value
+
 
 def discover_modules(
     directory_path: str,
     pattern: str = "*.py",
     exclude_patterns: Optional[List[str]] = None,
     required_attrs: Optional[List[str]] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    source_prefilter: bool = False
 ) -> Dict[str, Any]:
     """
     Discover and load Python modules from a directory.
 
+    With _PARALLEL_LOAD_MIN_FILES (4) or more candidate files, modules are
+    loaded on a thread pool, so plugin top-level code runs on worker threads.
+    Main-thread-only calls at import time (e.g. signal.signal) then raise and
+    the plugin is reported as failing to load; move them into a setup
+    function called after discovery.
+
     Args:
         directory_path: Directory to search for modules
         pattern: Glob pattern for module files (default: "*.py")
         exclude_patterns: List of filename patterns to exclude
         required_attrs: List of required module attributes (e.g., ["TOOL_SCHEMAS"])
         verbose: Print discovery progress
+        source_prefilter: With required_attrs, skip files whose source never
+            mentions every required name instead of executing them. Opt-in:
+            modules that gain attributes indirectly (star imports, setattr,
+            generated names) are skipped too. Skips are logged at DEBUG.
 
     Returns:
         Dictionary mapping module names to loaded module objects
@@ -72,11 +132,11 @@ def discover_modules(
         >>> print(f"Loaded {len(modules)} plugins")
     """
     if exclude_patterns is None:
-        exclude_patterns = ["__init__", "__pycache__", "test_", ".pyc"]
+        exclude_patterns = ["__init__", "test_", ".pyc"]
 
     directory = Path(directory_path)
     if not directory.exists() or not directory.is_dir():
-        logger.warning(f"Directory not found: {directory_path}")
+        logger.warning("Directory not found: %s", directory_path)
         return {}
 
     # Add directory to sys.path if not present
@@ -87,52 +147,188 @@ def discover_modules(
     loaded_modules = {}
 
     # Find all Python files matching pattern
-    for file_path in directory.glob(pattern):
-        # Skip excluded patterns
-        if any(excl in file_path.name for excl in exclude_patterns):
-            continue
-
-        module_name = file_path.stem
+    files = _list_module_files(directory, pattern, exclude_patterns)
+
+    # Cheap bytes scan rejects files that cannot define the required names,
+    # so they never pay the import cost
+    # Checked once so skipped/loaded messages cost nothing when INFO is off
+    log_info = verbose and logger.isEnabledFor(logging.INFO)
+
+    if required_attrs and source_prefilter:
+        candidates = []
+        for file_path in files:
+            if _source_mentions_required(file_path, required_attrs):
+                candidates.append(file_path)
+            else:
+                logger.log(
+                    logging.INFO if log_info else logging.DEBUG,
+                    "Skipping %s: source lacks required attributes", file_path
+                )
+        files = candidates
+
+    # Loading is dominated by file I/O, so larger batches are loaded on a
+    # thread pool; results are still consumed in file order below
+    executor = None
+    loaders: List[Callable[[], Any]]
+    if len(files) >= _PARALLEL_LOAD_MIN_FILES:
+        executor = ThreadPoolExecutor(max_workers=min(32, len(files)))
+        loaders = [
+            executor.submit(load_module_from_file, file_path, file_path.stem).result
+            for file_path in files
+        ]
+    else:
+        loaders = [
+            partial(load_module_from_file, file_path, file_path.stem)
+            for file_path in files
+        ]
 
-        try:
-            # Load module from file
-            module = load_module_from_file(file_path, module_name)
-
-            # Check for required attributes
-            if required_attrs:
-                missing_attrs = [
-                    attr for attr in required_attrs
-                    if not hasattr(module, attr)
-                ]
-                if missing_attrs:
-                    if verbose:
-                        logger.info(
-                            f"Module {module_name} missing required attributes: "
-                            f"{missing_attrs}"
-                        )
-                    continue
-
-            loaded_modules[module_name] = module
-
-            if verbose:
-                logger.info(f"Loaded module: {module_name}")
-
-        except Exception as e:
-            logger.error(f"Error loading module {file_path}: {e}")
-            if verbose:
-                import traceback
-                traceback.print_exc()
+    try:
+        for file_path, load in zip(files, loaders):
+            module_name = file_path.stem
+
+            try:
+                # Load module from file
+                module = load()
+
+                # Check for required attributes
+                if required_attrs:
+                    missing_attrs = [
+                        attr for attr in required_attrs
+                        if not hasattr(module, attr)
+                    ]
+                    if missing_attrs:
+                        if log_info:
+                            logger.info(
+                                "Module %s missing required attributes: %s",
+                                module_name, missing_attrs
+                            )
+                        continue
+
+                loaded_modules[module_name] = module
+
+                if log_info:
+                    logger.info("Loaded module: %s", module_name)
+
+            except Exception as e:
+                logger.error("Error loading module %s: %s", file_path, e)
+                if verbose:
+                    import traceback
+                    traceback.print_exc()
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return loaded_modules
 
 
-def load_module_from_file(file_path: Path, module_name: Optional[str] = None) -> Any:
+def _list_module_files(
+    directory: Path,
+    pattern: str,
+    exclude_patterns: List[str]
+) -> List[Path]:
+    """
+    List files in a directory matching a glob pattern, minus exclusions.
+
+    Single-component patterns are matched with one compiled regex against
+    os.scandir entry names, and exclusions are checked with one compiled
+    alternation, so Path objects are only built for surviving entries.
+    Directories (including __pycache__) are skipped using the entry's cached
+    type. Patterns containing a path separator fall back to Path.glob.
+    """
+    exclude_re = (
+        re.compile('|'.join(map(re.escape, exclude_patterns)))
+        if exclude_patterns else None
+    )
+
+    if '/' in pattern or os.sep in pattern:
+        return [
+            path for path in directory.glob(pattern)
+            if not (exclude_re and exclude_re.search(path.name))
+            and not path.is_dir()
+        ]
+
+    match = re.compile(fnmatch.translate(pattern)).match
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if match(entry.name)
+            and not entry.is_dir(follow_symlinks=False)
+            and not (exclude_re and exclude_re.search(entry.name))
+        ]
+
+
+def _source_mentions_required(file_path: Path, required_attrs: List[str]) -> bool:
+    """
+    Check whether a source file mentions every required attribute name.
+
+    A memory-mapped bytes search, used to reject plugins before importing
+    them. A True result is only a hint; the real attribute check still runs
+    after the module is loaded.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                return all(source.find(attr.encode()) != -1 for attr in required_attrs)
+    except ValueError:
+        # Empty files cannot be mapped (and define nothing)
+        return False
+    except OSError:
+        # Let the regular load path surface the error
+        return True
+
+
+def _load_fresh_pyc(path_str: str, st: os.stat_result) -> Optional[CodeType]:
+    """
+    Return the code object from a timestamp-validated .pyc, or None.
+
+    Mirrors the check SourceFileLoader does (magic, flags, source mtime and
+    size) so the caller can exec the code without going through the loader.
+    Hash-based pycs and anything stale or unreadable return None.
+    """
+    try:
+        cached = importlib.util.cache_from_source(path_str)
+        with open(cached, 'rb') as f:
+            data = f.read()
+    except (NotImplementedError, ValueError, OSError):
+        return None
+
+    if (
+        len(data) < 16
+        or data[:4] != importlib.util.MAGIC_NUMBER
+        or data[4:8] != b'\x00\x00\x00\x00'
+        or int.from_bytes(data[8:12], 'little') != (int(st.st_mtime) & 0xFFFFFFFF)
+        or int.from_bytes(data[12:16], 'little') != (st.st_size & 0xFFFFFFFF)
+    ):
+        return None
+
+    try:
+        code = marshal.loads(memoryview(data)[16:])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(code, CodeType):
+        return None
+
+    if _fix_co_filename is not None:
+        _fix_co_filename(code, path_str)
+    return code
+
+
+def load_module_from_file(
+    file_path: Path,
+    module_name: Optional[str] = None,
+    use_cache: bool = True
+) -> Any:
     """
     Load a Python module from a file path.
 
+    Repeat loads of an unchanged file return the previously executed module
+    instead of running its top-level code again. A changed mtime triggers a
+    fresh load, so hot-reload loops still pick up edits.
+
     Args:
         file_path: Path to Python file
         module_name: Name for the module (defaults to file stem)
+        use_cache: Reuse the cached module if the file's mtime is unchanged
 
     Returns:
         Loaded module object
@@ -146,35 +342,82 @@ def load_module_from_file(file_path: Path, module_name: Optional[str] = None) ->
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         raise ImportError(f"Module file not found: {file_path}")
+    mtime = st.st_mtime
 
     if module_name is None:
         module_name = file_path.stem
 
-    # Create module spec from file location
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    path_str = str(file_path)
+
+    with _LOAD_LOCKS_GUARD:
+        name_lock = _LOAD_LOCKS.setdefault(module_name, threading.RLock())
+
+    # Reentrant, so a module whose top-level code loads itself doesn't deadlock
+    with name_lock:
+        if use_cache:
+            cached = _MODULE_MTIME_CACHE.get(module_name)
+            if cached and cached[0] == path_str and cached[1] == mtime:
+                return cached[2]
+
+        # Create module spec from file location
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+
+        if spec is None:
+            raise ImportError(f"Could not create module spec for {file_path}")
 
-    if spec is None:
-        raise ImportError(f"Could not create module spec for {file_path}")
+        # Create module from spec
+        module = importlib.util.module_from_spec(spec)
 
-    # Create module from spec
-    module = importlib.util.module_from_spec(spec)
+        # Add to sys.modules
+        sys.modules[module_name] = module
 
-    # Add to sys.modules
-    sys.modules[module_name] = module
+        # Execute module, straight from a fresh .pyc when there is one
+        code = _load_fresh_pyc(path_str, st)
+        if code is not None:
+            exec(code, module.__dict__)
+        else:
+            spec.loader.exec_module(module)
 
-    # Execute module
-    spec.loader.exec_module(module)
+        _MODULE_MTIME_CACHE[module_name] = (path_str, mtime, module)
 
     return module
 
 
+@dataclass
+class ModuleInfo:
+    """
+    A discovered module and the interface pattern it matched.
+
+    The attribute listing is computed on first access rather than stored for
+    every module. Item access (info["pattern"]) is kept for callers written
+    against the older dict results.
+    """
+    module: Any
+    pattern: Optional[Tuple[str, ...]] = None
+
+    @property
+    def has_pattern(self) -> bool:
+        return self.pattern is not None
+
+    @cached_property
+    def attributes(self) -> List[str]:
+        return dir(self.module)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in ("module", "pattern", "has_pattern", "attributes"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+
 def discover_with_pattern_detection(
     directory_path: str,
     patterns: Optional[List[Tuple[str, ...]]] = None,
     verbose: bool = False
-) -> Dict[str, Dict[str, Any]]:
+) -> Dict[str, ModuleInfo]:
     """
     Discover modules and detect which pattern they follow.
 
@@ -190,12 +433,12 @@ def discover_with_pattern_detection(
         verbose: Print discovery details
 
     Returns:
-        Dictionary with module info including detected pattern
+        Dictionary of ModuleInfo, one per module, with the detected pattern
 
     Examples:
         >>> discovered = discover_with_pattern_detection("./hive")
         >>> for name, info in discovered.items():
-        ...     print(f"{name}: {info['pattern']}")
+        ...     print(f"{name}: {info.pattern}")
     """
     if patterns is None:
         patterns = [
@@ -211,23 +454,22 @@ def discover_with_pattern_detection(
     # Load all modules first
     modules = discover_modules(directory_path, verbose=verbose)
 
+    log_info = verbose and logger.isEnabledFor(logging.INFO)
+
     for module_name, module in modules.items():
+        mod_vars = getattr(module, '__dict__', {})
+
         # Detect which pattern this module follows
         detected_pattern = None
         for pattern in patterns:
-            if all(hasattr(module, attr) for attr in pattern):
+            if all(_lookup_attr(module, mod_vars, name) is not _MISSING for name in pattern):
                 detected_pattern = pattern
                 break
 
-        discovered[module_name] = {
-            "module": module,
-            "pattern": detected_pattern,
-            "has_pattern": detected_pattern is not None,
-            "attributes": dir(module)
-        }
+        discovered[module_name] = ModuleInfo(module, detected_pattern)
 
-        if verbose and detected_pattern:
-            logger.info(f"Module {module_name} matches pattern: {detected_pattern}")
+        if log_info and detected_pattern:
+            logger.info("Module %s matches pattern: %s", module_name, detected_pattern)
 
     return discovered
 
@@ -247,6 +489,7 @@ def reload_module(module: Any) -> Any:
         >>> my_module = reload_module(my_module)
     """
     import importlib
+    _FUNC_CACHE.pop(module, None)
     return importlib.reload(module)
 
 
@@ -258,6 +501,9 @@ def get_module_functions(
     """
     Get all functions from a module.
 
+    Results are cached per module and filter combination; reload_module()
+    clears the entry for a reloaded module.
+
     Args:
         module: Module object
         filter_prefix: Only include functions starting with this prefix
@@ -271,13 +517,21 @@ def get_module_functions(
         >>> for name, func in functions.items():
         ...     print(f"Found tool function: {name}")
     """
-    import inspect
+    key = (filter_prefix, exclude_private)
+    try:
+        bucket = _FUNC_CACHE.setdefault(module, {})
+    except TypeError:
+        # Object does not support weak references; skip caching
+        bucket = {}
+    if key in bucket:
+        return dict(bucket[key])
 
     functions = {}
 
-    for name, obj in inspect.getmembers(module):
+    # Walk the namespace directly: no sort, no descriptor-triggering getattr
+    for name, obj in vars(module).items():
         # Skip if not a function
-        if not inspect.isfunction(obj):
+        if not isinstance(obj, FunctionType):
             continue
 
         # Skip private functions if requested
@@ -290,7 +544,8 @@ def get_module_functions(
 
         functions[name] = obj
 
-    return functions
+    bucket[key] = functions
+    return dict(functions)
 
 
 def validate_module_interface(
@@ -318,20 +573,20 @@ def validate_module_interface(
         >>> if not valid:
         ...     print(f"Module missing: {missing}")
     """
-    import inspect
-
     missing = []
+    mod_vars = getattr(module, '__dict__', {})
 
     if required_functions:
         for func_name in required_functions:
-            if not hasattr(module, func_name):
+            value = _lookup_attr(module, mod_vars, func_name)
+            if value is _MISSING:
                 missing.append(f"function: {func_name}")
-            elif not callable(getattr(module, func_name)):
+            elif not callable(value):
                 missing.append(f"callable: {func_name}")
 
     if required_attrs:
         for attr_name in required_attrs:
-            if not hasattr(module, attr_name):
+            if _lookup_attr(module, mod_vars, attr_name) is _MISSING:
                 missing.append(f"attribute: {attr_name}")
 
     return len(missing) == 0, missing
@@ -413,7 +668,7 @@ def some_function():
         print("\n4. Detect module patterns:")
         discovered = discover_with_pattern_detection(temp_dir, verbose=True)
         for name, info in discovered.items():
-            pattern = info['pattern'] or "No pattern"
+            pattern = info.pattern or "No pattern"
             print(f"   {name}: {pattern}")
 
         # Example 5: Get module functions
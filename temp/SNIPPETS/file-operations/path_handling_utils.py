@@ -34,20 +34,33 @@ Source Attribution:
 - Author: Luke Steuber
 """
 
+import fnmatch
+import functools
 import os
-from pathlib import Path
-from typing import Optional, Union, List, Tuple
+import re
+from pathlib import Path, PurePath
+from typing import Iterator, Optional, Union, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_ROOT_MARKERS = ('.git', 'pyproject.toml', 'setup.py', '.swarm', 'package.json')
 
-def ensure_absolute_path(path: Union[str, Path]) -> Path:
+
+def ensure_absolute_path(
+    path: Union[str, Path],
+    follow_symlinks: bool = False
+) -> Path:
     """
     Convert any path to an absolute Path object.
 
+    Already-absolute paths are returned without touching the filesystem.
+    Relative paths are made absolute lexically with os.path.abspath unless
+    follow_symlinks is set, in which case they are fully resolved.
+
     Args:
         path: Path string or Path object
+        follow_symlinks: Resolve symlinks for relative paths (slower)
 
     Returns:
         Absolute Path object
@@ -58,17 +71,19 @@ def ensure_absolute_path(path: Union[str, Path]) -> Path:
         >>> ensure_absolute_path("~/Documents")
         PosixPath('/home/user/Documents')
     """
-    path = Path(path)
+    path = os.fspath(path)
 
     # Expand user directory (~)
-    if str(path).startswith('~'):
-        path = path.expanduser()
+    if path.startswith('~'):
+        path = os.path.expanduser(path)
 
-    # Convert to absolute path
-    if not path.is_absolute():
-        path = path.resolve()
+    if os.path.isabs(path):
+        return Path(path)
 
-    return path
+    # Convert to absolute path
+    if follow_symlinks:
+        return Path(path).resolve()
+    return Path(os.path.abspath(path))
 
 
 def find_project_root(
@@ -80,6 +95,10 @@ def find_project_root(
 
     Common markers: .git, pyproject.toml, setup.py, package.json
 
+    Results are cached per (start directory, markers). Call
+    find_project_root.cache_clear() if markers are created or removed
+    while the process is running.
+
     Args:
         start_path: Directory to start searching from (defaults to cwd)
         markers: List of marker files/dirs to look for
@@ -92,19 +111,45 @@ def find_project_root(
         >>> print(root)
         /home/user/my-project
     """
-    if markers is None:
-        markers = ['.git', 'pyproject.toml', 'setup.py', '.swarm', 'package.json']
+    start = os.path.realpath(start_path if start_path else os.getcwd())
+    root = _find_project_root_cached(
+        start, tuple(markers) if markers is not None else _DEFAULT_ROOT_MARKERS
+    )
+    return Path(root) if root is not None else None
 
-    current = Path(start_path) if start_path else Path.cwd()
-    current = current.resolve()
 
-    # Walk up the directory tree
-    for parent in [current] + list(current.parents):
-        for marker in markers:
-            if (parent / marker).exists():
-                return parent
+@functools.lru_cache(maxsize=128)
+def _find_project_root_cached(start: str, markers: Tuple[str, ...]) -> Optional[str]:
+    """Walk up from a resolved start directory; cached by find_project_root."""
+    current = start
+
+    marker_set = frozenset(markers)
+    # Markers with a separator (e.g. "config/app.yaml") need a real lookup
+    nested_markers = [m for m in markers if '/' in m or os.sep in m]
+
+    # Walk up as plain strings, one directory read per level
+    while True:
+        try:
+            with os.scandir(current) as entries:
+                if not marker_set.isdisjoint(entry.name for entry in entries):
+                    return current
+        except OSError:
+            # Unreadable directory: fall back to probing each marker
+            if any(os.path.exists(os.path.join(current, m)) for m in markers):
+                return current
 
-    return None
+        if nested_markers and any(
+            os.path.exists(os.path.join(current, m)) for m in nested_markers
+        ):
+            return current
+
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+find_project_root.cache_clear = _find_project_root_cached.cache_clear
 
 
 def ensure_dir_exists(path: Union[str, Path], parents: bool = True) -> Path:
@@ -201,23 +246,41 @@ def safe_join(*paths: Union[str, Path]) -> Path:
         raise ValueError("At least one path component required")
 
     base = Path(paths[0]).resolve()
-    result = base
 
-    for component in paths[1:]:
-        # Join and resolve
-        result = (result / component).resolve()
-
-        # Check if result is within base
-        try:
-            result.relative_to(base)
-        except ValueError:
-            raise ValueError(
-                f"Path traversal detected: {component} would escape {base}"
-            )
+    # Join in memory and resolve once; only the final location matters
+    result = base.joinpath(*paths[1:]).resolve()
+
+    # Check if result is within base
+    base_str = str(base)
+    result_str = str(result)
+    if not (
+        result_str == base_str
+        or result_str.startswith(base_str.rstrip(os.sep) + os.sep)
+    ):
+        raise ValueError(
+            f"Path traversal detected: {os.path.join(*map(str, paths[1:]))} "
+            f"would escape {base}"
+        )
 
     return result
 
 
+def _split_suffix(path: str) -> Tuple[str, str]:
+    """Split a path string into (stem_path, suffix) with Path.suffix rules."""
+    path = path.rstrip(os.sep + (os.altsep or ''))
+    name = os.path.basename(path)
+    if name == '.':
+        # Trailing '.' components are dropped by PurePath; let it normalise
+        pure = str(PurePath(path))
+        suffix = PurePath(pure).suffix
+        return pure[:len(pure) - len(suffix)], suffix
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        cut = len(path) - len(name) + i
+        return path[:cut], path[cut:]
+    return path, ''
+
+
 def get_file_extension(path: Union[str, Path], include_dot: bool = True) -> str:
     """
     Get file extension from path.
@@ -235,12 +298,15 @@ def get_file_extension(path: Union[str, Path], include_dot: bool = True) -> str:
         >>> get_file_extension("data.tar.gz", include_dot=False)
         'gz'
     """
-    path = Path(path)
+    if isinstance(path, str):
+        suffix = _split_suffix(path)[1]
+    else:
+        suffix = Path(path).suffix
 
     if include_dot:
-        return path.suffix
+        return suffix
     else:
-        return path.suffix.lstrip('.')
+        return suffix.lstrip('.')
 
 
 def change_extension(path: Union[str, Path], new_ext: str) -> Path:
@@ -260,12 +326,85 @@ def change_extension(path: Union[str, Path], new_ext: str) -> Path:
         >>> change_extension("report.txt", "md")
         PosixPath('report.md')
     """
-    path = Path(path)
-
     if not new_ext.startswith('.'):
         new_ext = '.' + new_ext
 
-    return path.with_suffix(new_ext)
+    # String fast path; edge cases go through Path for its validation errors
+    if (
+        isinstance(path, str)
+        and len(new_ext) > 1
+        and os.sep not in new_ext
+        and not (os.altsep and os.altsep in new_ext)
+    ):
+        base = _split_suffix(path)[0]
+        if os.path.basename(base) not in ('', '.', '..'):
+            return Path(base + new_ext)
+
+    return Path(path).with_suffix(new_ext)
+
+
+def iter_files(
+    directory: Union[str, Path],
+    pattern: str = "*",
+    recursive: bool = False,
+    files_only: bool = True
+) -> Iterator[Path]:
+    """
+    Lazily yield files matching a pattern in a directory.
+
+    Uses os.scandir so entry types come from the directory read itself,
+    and Path objects are only built for matches. Callers can stop
+    early without scanning the whole tree.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob pattern for names (e.g., "*.py", "test_*.json")
+        recursive: Search subdirectories recursively
+        files_only: Only yield files (not directories)
+
+    Yields:
+        Matching Path objects
+
+    Examples:
+        >>> first_log = next(iter_files("./logs", "*.log"), None)
+    """
+    directory = os.fspath(directory)
+
+    if not os.path.isdir(directory):
+        return
+
+    # Multi-component patterns need pathlib's glob semantics
+    if '/' in pattern or os.sep in pattern:
+        root = Path(directory)
+        matches = root.rglob(pattern) if recursive else root.glob(pattern)
+        for path in matches:
+            if not files_only or path.is_file():
+                yield path
+        return
+
+    match = re.compile(fnmatch.translate(pattern)).match
+
+    # Explicit stack of directories; each is read once with os.scandir and
+    # every decision uses the DirEntry's cached type. Like rglob, symlinked
+    # directories are reported but not descended into.
+    pending = [directory]
+    while pending:
+        top = pending.pop()
+        subdirs = []
+        try:
+            entries = os.scandir(top)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                is_dir = entry.is_dir()
+                if recursive and is_dir and not entry.is_symlink():
+                    subdirs.append(entry.path)
+                if match(entry.name) and (
+                    not files_only or (not is_dir and entry.is_file())
+                ):
+                    yield Path(entry.path)
+        pending.extend(reversed(subdirs))
 
 
 def find_files(
@@ -290,20 +429,7 @@ def find_files(
         >>> py_files = find_files("./src", "*.py", recursive=True)
         >>> test_files = find_files("./tests", "test_*.py")
     """
-    directory = Path(directory)
-
-    if not directory.exists():
-        return []
-
-    if recursive:
-        matches = directory.rglob(pattern)
-    else:
-        matches = directory.glob(pattern)
-
-    if files_only:
-        return [p for p in matches if p.is_file()]
-    else:
-        return list(matches)
+    return list(iter_files(directory, pattern, recursive, files_only))
 
 
 def get_relative_path(
@@ -30,18 +30,65 @@
 # - Headers use ## for section detection
 # - Tables must have proper markdown format with header separator
 # - Nested sections (###) can be parsed with custom patterns
+# - read_frontmatter() reads only the file head for metadata-only scans
+# - parse_markdown_file() caches results by (path, mtime, size)
+# - Scanning is done with str.find / regex / split, which already run in C;
+#   there's no per-character Python loop left for an extension to replace
 #
 # Related Snippets:
 # - /home/coolhand/SNIPPETS/file-operations/module_discovery.py
 # - /home/coolhand/SNIPPETS/configuration-management/multi_source_config.py
 # ================================================
 
+import functools
+import itertools
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed
+except ImportError:
+    _YamlLoader = yaml.SafeLoader
+
+# Section names, table headers and code languages repeat heavily across a
+# corpus; interning lets every parsed dict share one key object per name
+_intern = sys.intern
+
+# Closing frontmatter delimiter
+_FM_END = '\n---\n'
+_FM_END_BYTES = b'\n---\n'
+
+# Extractor patterns, compiled on first use by _re() so importing this module
+# for frontmatter alone doesn't pay for them
+_PATTERNS: Dict[str, Tuple[str, int]] = {
+    # "1. item" lines, trimmed the same way as the bullets below
+    'numbered': (r'^[^\S\n]*\d+\.[^\S\n]+(\S(?:[^\n]*\S)?)[^\S\n]*$', re.MULTILINE),
+    # "- item" / "* item" lines; [^\S\n] is whitespace that can't cross a line
+    'bullet': (r'^[^\S\n]*[-*] [^\S\n]*(\S(?:[^\n]*\S)?)[^\S\n]*$', re.MULTILINE),
+    # Language tag after an opening ``` fence
+    'fence_lang': (r'\w*', 0),
+    # **Key**: `value` or **Key**: value; the backticked branch is tried first.
+    # The plain value excludes surrounding whitespace and backticks.
+    'kv': (
+        r'\*\*(.+?)\*\*:\s+(?:`([^`\n]+)`'
+        r'|(?=[^\n])[^\S\n]*`*(.*?)`*[^\S\n]*$)',
+        re.MULTILINE
+    ),
+}
+
+
+@functools.cache
+def _re(name: str) -> "re.Pattern[str]":
+    """Compiled extractor pattern by name, compiled once per process."""
+    pattern, flags = _PATTERNS[name]
+    return re.compile(pattern, flags)
+
 
 # ============================================================================
 # FRONTMATTER PARSING
@@ -74,26 +121,158 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
         return {}, content
 
     # Find the closing ---
-    end_match = re.search(r'\n---\n', content[3:])
-    if not end_match:
+    end = content.find(_FM_END, 3)
+    if end < 0:
         return {}, content
 
     # Extract frontmatter text (between --- markers)
-    frontmatter_text = content[3:end_match.start() + 3]
-    remaining = content[end_match.end() + 3:]
+    frontmatter_text = content[3:end]
+    remaining = content[end + len(_FM_END):]
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
         return frontmatter or {}, remaining
     except yaml.YAMLError as e:
         print(f"Warning: Failed to parse YAML frontmatter: {e}")
         return {}, content
 
 
+def _read_markdown(file_path: Path) -> str:
+    """
+    Read a markdown file as UTF-8 text with universal newlines.
+
+    Equivalent to read_text() on a UTF-8 system, but decodes the raw bytes
+    directly and only pays for newline translation when the text has a CR.
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _read_head(file_path: Path, max_bytes: int = 8192) -> bytes:
+    """Read at most max_bytes from the start of a file."""
+    with open(file_path, 'rb') as f:
+        return f.read(max_bytes)
+
+
+def read_frontmatter(file_path: Path, max_bytes: int = 8192) -> Dict[str, Any]:
+    """
+    Read only the YAML frontmatter of a markdown file.
+
+    Looks for the closing '---' in the first max_bytes of the file and
+    decodes just that region, so bulk metadata scans don't read whole
+    documents. Falls back to a full read when the frontmatter is longer
+    than the window or the file uses CRLF line endings.
+
+    Args:
+        file_path: Path to markdown file
+        max_bytes: Size of the initial read window
+
+    Returns:
+        Frontmatter dict (empty if none)
+
+    Example:
+        >>> meta = read_frontmatter(Path('agents/scout.md'))
+        >>> meta.get('model')
+        'sonnet'
+    """
+    head = _read_head(file_path, max_bytes)
+    if not head.startswith(b'---'):
+        return {}
+
+    end = head.find(_FM_END_BYTES, 3)
+    if end >= 0 and b'\r' not in head[:end]:
+        try:
+            text = head[:end + len(_FM_END_BYTES)].decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        else:
+            return parse_frontmatter(text)[0]
+
+    return parse_frontmatter(_read_markdown(file_path))[0]
+
+
 # ============================================================================
 # SECTION PARSING
 # ============================================================================
 
+def _header_line_starts(content: str, marker: str) -> List[int]:
+    """Offsets of the lines in content that start with marker, in order."""
+    starts = [0] if content.startswith(marker) else []
+    find = content.find
+    needle = '\n' + marker
+    pos = find(needle)
+    while pos >= 0:
+        starts.append(pos + 1)
+        pos = find(needle, pos + 1)
+    return starts
+
+
+def _header_starts(content: str, *markers: str) -> List[int]:
+    """Offsets of the lines in content that start with any of the markers."""
+    if len(markers) == 1:
+        return _header_line_starts(content, markers[0])
+    starts = set()
+    for marker in markers:
+        starts.update(_header_line_starts(content, marker))
+    return sorted(starts)
+
+
+def _pipe_lines(text: str) -> List[str]:
+    """Stripped lines of text that contain '|'."""
+    if '|' not in text:
+        return []
+    return [line.strip() for line in text.split('\n') if '|' in line]
+
+
+def _scan_sections(
+    content: str,
+    header_level: str = "## ",
+    collect_tables: bool = False
+) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    Section scan behind parse_sections and parse_markdown_file.
+
+    Header lines are located with substring searches and each section's
+    text is sliced straight out of content, so body lines are never visited
+    one by one. Returns (sections, table_lines); with collect_tables, table_lines
+    maps each section to its stripped pipe-containing lines.
+    """
+    sections = {}
+    table_lines = {}
+    current_section = None
+    body_start = 0
+    marker_len = len(header_level)
+    find = content.find
+    content_len = len(content)
+
+    for start in _header_starts(content, header_level):
+        # Save previous section
+        if current_section:
+            body = content[body_start:start]
+            sections[current_section] = body.strip()
+            if collect_tables:
+                table_lines[current_section] = _pipe_lines(body)
+
+        # Start new section
+        end = find('\n', start)
+        if end < 0:
+            end = content_len
+        current_section = _intern(content[start + marker_len:end].strip())
+        body_start = end + 1
+
+    # Save final section
+    if current_section:
+        body = content[body_start:]
+        sections[current_section] = body.strip()
+        if collect_tables:
+            table_lines[current_section] = _pipe_lines(body)
+
+    return sections, table_lines
+
+
 def parse_sections(content: str, header_level: str = "## ") -> Dict[str, str]:
     """
     Parse markdown into sections by header level.
@@ -116,27 +295,7 @@ def parse_sections(content: str, header_level: str = "## ") -> Dict[str, str]:
         >>> 'Introduction' in sections
         True
     """
-    sections = {}
-    current_section = None
-    current_content = []
-
-    for line in content.split('\n'):
-        if line.startswith(header_level):
-            # Save previous section
-            if current_section:
-                sections[current_section] = '\n'.join(current_content).strip()
-
-            # Start new section
-            current_section = line[len(header_level):].strip()
-            current_content = []
-        elif current_section:
-            current_content.append(line)
-
-    # Save final section
-    if current_section:
-        sections[current_section] = '\n'.join(current_content).strip()
-
-    return sections
+    return _scan_sections(content, header_level)[0]
 
 
 def parse_nested_sections(
@@ -170,40 +329,38 @@ def parse_nested_sections(
     nested = {}
     current_l2 = None
     current_l3 = None
-    current_content = []
-
-    for line in content.split('\n'):
-        if line.startswith(level2_marker) and not line.startswith(level3_marker):
-            # Save previous L3 section
-            if current_l2 and current_l3:
-                if current_l2 not in nested:
-                    nested[current_l2] = {}
-                nested[current_l2][current_l3] = '\n'.join(current_content).strip()
-
+    l2_len = len(level2_marker)
+    l3_len = len(level3_marker)
+    find = content.find
+    content_len = len(content)
+    body_start = 0
+
+    for start in _header_starts(content, level2_marker, level3_marker):
+        # Save previous L3 section
+        if current_l2 and current_l3:
+            if current_l2 not in nested:
+                nested[current_l2] = {}
+            nested[current_l2][current_l3] = content[body_start:start].strip()
+
+        end = find('\n', start)
+        if end < 0:
+            end = content_len
+
+        # Level 3 first, so a level 2 marker never needs a second check
+        if content.startswith(level3_marker, start):
+            # Start new L3 section
+            current_l3 = _intern(content[start + l3_len:end].strip())
+        else:
             # Start new L2 section
-            current_l2 = line[len(level2_marker):].strip()
+            current_l2 = _intern(content[start + l2_len:end].strip())
             current_l3 = None
-            current_content = []
-
-        elif line.startswith(level3_marker):
-            # Save previous L3 section
-            if current_l2 and current_l3:
-                if current_l2 not in nested:
-                    nested[current_l2] = {}
-                nested[current_l2][current_l3] = '\n'.join(current_content).strip()
-
-            # Start new L3 section
-            current_l3 = line[len(level3_marker):].strip()
-            current_content = []
-
-        elif current_l2:
-            current_content.append(line)
+        body_start = end + 1
 
     # Save final section
     if current_l2 and current_l3:
         if current_l2 not in nested:
             nested[current_l2] = {}
-        nested[current_l2][current_l3] = '\n'.join(current_content).strip()
+        nested[current_l2][current_l3] = content[body_start:].strip()
 
     return nested
 
@@ -233,22 +390,28 @@ def parse_table(content: str) -> List[Dict[str, str]]:
         >>> rows[0]['Name']
         'Alice'
     """
-    lines = [line.strip() for line in content.split('\n') if line.strip() and '|' in line]
+    return _table_rows(_pipe_lines(content))
+
+
+def _table_rows(lines: List[str]) -> List[Dict[str, str]]:
+    """Build table rows from stripped lines that contain '|'."""
     if len(lines) < 2:
         return []
 
     # Parse header
-    headers = [h.strip() for h in lines[0].split('|') if h.strip()]
+    headers = [_intern(h) for h in map(str.strip, lines[0].split('|')) if h]
 
     # Skip separator line (contains ---)
     rows = []
-    for line in lines[1:]:
+    n_headers = len(headers)
+    for line in itertools.islice(lines, 1, None):
         if '---' in line:
             continue
 
-        cells = [c.strip() for c in line.split('|') if c.strip()]
-        if len(cells) >= len(headers):
-            rows.append(dict(zip(headers, cells[:len(headers)])))
+        cells = [c for c in map(str.strip, line.split('|')) if c]
+        if len(cells) >= n_headers:
+            # zip stops at the last header, so extra cells need no slice
+            rows.append(dict(zip(headers, cells)))
 
     return rows
 
@@ -277,14 +440,21 @@ def parse_bullet_list(content: str) -> List[str]:
         >>> len(items)
         3
     """
-    items = []
-    for line in content.split('\n'):
-        line = line.strip()
-        if line.startswith('- '):
-            items.append(line[2:].strip())
-        elif line.startswith('* '):
-            items.append(line[2:].strip())
-    return items
+    return _re('bullet').findall(content)
+
+
+def iter_bullet_list(content: str) -> Iterator[str]:
+    """
+    Lazily yield bullet items; same items as parse_bullet_list.
+
+    Args:
+        content: Markdown content with bullet list
+
+    Yields:
+        Bullet items (without markers)
+    """
+    for match in _re('bullet').finditer(content):
+        yield match.group(1)
 
 
 def parse_numbered_list(content: str) -> List[str]:
@@ -307,13 +477,21 @@ def parse_numbered_list(content: str) -> List[str]:
         >>> items[0]
         'First item'
     """
-    items = []
-    for line in content.split('\n'):
-        line = line.strip()
-        match = re.match(r'^\d+\.\s+(.+)$', line)
-        if match:
-            items.append(match.group(1))
-    return items
+    return _re('numbered').findall(content)
+
+
+def iter_numbered_list(content: str) -> Iterator[str]:
+    """
+    Lazily yield numbered items; same items as parse_numbered_list.
+
+    Args:
+        content: Markdown content with numbered list
+
+    Yields:
+        Items (without numbers)
+    """
+    for match in _re('numbered').finditer(content):
+        yield match.group(1)
 
 
 # ============================================================================
@@ -344,16 +522,32 @@ def extract_code_blocks(content: str) -> Dict[str, List[str]]:
         2
     """
     code_blocks = {}
-    pattern = r'```(\w+)?\n(.*?)```'
+    find = content.find
+    match_lang = _re('fence_lang').match
+
+    # Fences are located with str.find, so an unclosed fence costs one
+    # linear scan instead of a lazy DOTALL regex retrying from each opener
+    pos = find('```')
+    while pos >= 0:
+        # Opening fence: ``` plus an optional language tag, then a newline
+        lang_end = match_lang(content, pos + 3).end()
+        if not content.startswith('\n', lang_end):
+            pos = find('```', pos + 1)
+            continue
+
+        close = find('```', lang_end + 1)
+        if close < 0:
+            break
 
-    for match in re.finditer(pattern, content, re.DOTALL):
-        language = match.group(1) or 'unknown'
-        code = match.group(2).strip()
+        language = _intern(content[pos + 3:lang_end]) if lang_end > pos + 3 else 'unknown'
+        code = content[lang_end + 1:close].strip()
 
         if language not in code_blocks:
             code_blocks[language] = []
         code_blocks[language].append(code)
 
+        pos = find('```', close + 3)
+
     return code_blocks
 
 
@@ -386,20 +580,15 @@ def extract_key_value_pairs(content: str) -> Dict[str, str]:
     """
     pairs = {}
 
-    # Pattern 1: **Key**: `value`
-    pattern1 = r'\*\*(.+?)\*\*:\s+`(.+?)`'
-    for match in re.finditer(pattern1, content):
-        pairs[match.group(1).strip()] = match.group(2).strip()
-
-    # Pattern 2: **Key:** value (without backticks)
-    pattern2 = r'\*\*(.+?)\*\*:\s+([^\n]+)'
-    for match in re.finditer(pattern2, content):
+    for match in _re('kv').finditer(content):
         key = match.group(1).strip()
-        if key not in pairs:  # Don't overwrite pattern 1 matches
-            value = match.group(2).strip()
-            # Remove backticks if present
-            value = value.strip('`')
-            pairs[key] = value
+        quoted = match.group(2)
+        if quoted is not None:
+            # **Key**: `value` - the last backticked value for a key wins
+            pairs[key] = quoted.strip()
+        elif key not in pairs:
+            # **Key**: value - first plain value, never over a backticked one
+            pairs[key] = match.group(3)
 
     return pairs
 
@@ -408,12 +597,18 @@ def extract_key_value_pairs(content: str) -> Dict[str, str]:
 # FILE PARSING
 # ============================================================================
 
-def parse_markdown_file(file_path: Path) -> Dict[str, Any]:
+def parse_markdown_file(file_path: Path, use_cache: bool = True) -> Dict[str, Any]:
     """
     Parse a markdown file with frontmatter and sections.
 
+    Results are cached by (path, mtime, size), so re-parsing an unchanged
+    file is a stat plus a dict copy. The returned dict is a fresh copy but
+    the nested frontmatter/sections/tables are shared with the cache; copy
+    them before mutating.
+
     Args:
         file_path: Path to markdown file
+        use_cache: Reuse the parse of an unchanged file
 
     Returns:
         Dict with 'frontmatter', 'sections', 'tables', etc.
@@ -425,30 +620,82 @@ def parse_markdown_file(file_path: Path) -> Dict[str, Any]:
         >>> 'Introduction' in result['sections']
         True
     """
-    content = file_path.read_text()
+    if not use_cache:
+        return _parse_all(_read_markdown(file_path), file_path)
+
+    st = os.stat(file_path)
+    result = dict(_parse_file_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size))
+    result['source_file'] = file_path
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_file_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse keyed on file identity; mtime_ns and size only key the cache."""
+    return _parse_all(_read_markdown(path), Path(path))
+
+
+def parse_markdown_files(
+    file_paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False
+) -> Dict[Path, Dict[str, Any]]:
+    """
+    Parse many markdown files concurrently.
 
+    Threads overlap the file reads; parsing itself holds the GIL, so large
+    CPU-bound batches can pass use_processes=True (the per-file cache then
+    lives in the worker processes and doesn't carry over between calls).
+
+    Args:
+        file_paths: Paths to parse
+        max_workers: Pool size (defaults to the executor's own default)
+        use_processes: Use a process pool instead of a thread pool
+
+    Returns:
+        Dict mapping each path to its parse_markdown_file result, in input order
+
+    Example:
+        >>> docs = parse_markdown_files(Path('agents').glob('*.md'))
+        >>> print(len(docs))
+    """
+    paths = [Path(p) for p in file_paths]
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(parse_markdown_file, paths)))
+
+
+def _parse_all(content: str, source_file: Optional[Path] = None) -> Dict[str, Any]:
+    """Parse frontmatter, sections, tables and code blocks from content."""
     # Parse frontmatter
     frontmatter, body = parse_frontmatter(content)
 
-    # Parse sections
-    sections = parse_sections(body)
+    # Cheap substring probes let plain documents skip whole passes
+    if '## ' in body:
+        # Sections and their table lines in one pass over the body
+        sections, table_lines = _scan_sections(body, collect_tables='|' in body)
+    else:
+        sections, table_lines = {}, {}
 
-    # Parse tables from all sections
+    # A table needs a header line plus at least one more pipe line, so
+    # sections below that are skipped without building rows
     tables = {}
-    for section_name, section_content in sections.items():
-        table_data = parse_table(section_content)
+    for section_name, lines in table_lines.items():
+        if len(lines) < 2:
+            continue
+        table_data = _table_rows(lines)
         if table_data:
             tables[section_name] = table_data
 
     # Extract code blocks
-    code_blocks = extract_code_blocks(body)
+    code_blocks = extract_code_blocks(body) if '```' in body else {}
 
     return {
         'frontmatter': frontmatter,
         'sections': sections,
         'tables': tables,
         'code_blocks': code_blocks,
-        'source_file': file_path,
+        'source_file': source_file,
     }
 
 
@@ -505,9 +752,8 @@ This agent performs reconnaissance on code repositories.
             print(f"  {row}")
 
     if 'Quality Standards' in sections:
-        standards = parse_numbered_list(sections['Quality Standards'])
         print(f"\nQuality Standards:")
-        for standard in standards:
+        for standard in iter_numbered_list(sections['Quality Standards']):
             print(f"  - {standard}")
 
     # Example 2: Nested sections
@@ -33,10 +33,15 @@ import subprocess
 import signal
 import time
 import json
+import fcntl
+import heapq
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import psutil
 
 # Service configurations
@@ -47,6 +52,7 @@ SERVICES = {
         'working_dir': '/home/user/api',
         'port': 8000,
         'health_endpoint': 'http://localhost:8000/health',
+        'health_method': 'HEAD',  # or 'GET' if the endpoint rejects HEAD
         'start_timeout': 10,
         'description': 'Main API server'
     },
@@ -56,6 +62,7 @@ SERVICES = {
         'working_dir': '/home/user/worker',
         'port': 8001,
         'health_endpoint': 'http://localhost:8001/health',
+        'health_method': 'GET',
         'start_timeout': 5,
         'description': 'Async task processor'
     }
@@ -67,12 +74,63 @@ PID_DIR = HOME_DIR / '.service_manager' / 'pids'
 LOG_DIR = HOME_DIR / '.service_manager' / 'logs'
 STATE_DIR = HOME_DIR / '.service_manager' / 'state'
 
+# Health check (connect, read) timeouts; a dead host fails on connect fast
+HEALTH_TIMEOUT = (1, 5)
+
+# Seconds a completed health check result is reused before probing again
+HEALTH_CACHE_TTL = 2.0
+
+# /proc stat parsing (Linux); other platforms use psutil
+_PROC_AVAILABLE = os.path.exists('/proc/self/stat')
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if _PROC_AVAILABLE else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if _PROC_AVAILABLE else 4096
+
 # Ensure directories exist
 PID_DIR.mkdir(parents=True, exist_ok=True)
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 STATE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+class ProcStat(NamedTuple):
+    """Raw fields from /proc/<pid>/stat (times in clock ticks, rss in pages)"""
+    utime: int
+    stime: int
+    starttime: int
+    rss: int
+
+
+def _read_proc_stat(pid: int) -> Optional[ProcStat]:
+    """Read and parse /proc/<pid>/stat with one open/read/close"""
+    try:
+        fd = os.open(f'/proc/{pid}/stat', os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        data = os.read(fd, 1024)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    # comm (field 2) may contain spaces or parens; fields resume after the last ')'.
+    # Split only as far as rss (field 24) instead of all ~50 fields.
+    fields = data[data.rfind(b')') + 2:].split(None, 22)
+    try:
+        return ProcStat(int(fields[11]), int(fields[12]), int(fields[19]), int(fields[21]))
+    except (IndexError, ValueError):
+        return None
+
+
+def _collect_proc_stats(pids: List[int]) -> Dict[int, ProcStat]:
+    """Gather /proc stats for several pids; pids that vanished are omitted"""
+    stats = {}
+    for pid in pids:
+        stat = _read_proc_stat(pid)
+        if stat is not None:
+            stats[pid] = stat
+    return stats
+
+
 class ServiceManager:
     """Manages multiple Python services with health checking and auto-restart"""
 
@@ -82,6 +140,23 @@ class ServiceManager:
         self.log_dir = LOG_DIR
         self.state_dir = STATE_DIR
 
+        # One keep-alive session shared by all health checks
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        # service_id -> (monotonic time the check finished, result)
+        self._health_cache: Dict[str, Tuple[float, Tuple[bool, str]]] = {}
+        self._health_locks: Dict[str, threading.Lock] = {}
+
+        # psutil handles kept across get_status calls so cpu_percent() can
+        # measure since the previous call instead of sleeping
+        self._proc_cache: Dict[str, psutil.Process] = {}
+
+        # Consecutive failed checks per service (used by run_supervisor)
+        self._failures: Dict[str, int] = {}
+
     def _get_pid_file(self, service_id: str) -> Path:
         """Get PID file path for a service"""
         return self.pid_dir / f"{service_id}.pid"
@@ -102,10 +177,17 @@ class ServiceManager:
         return None
 
     def _write_pid(self, service_id: str, pid: int):
-        """Write PID to file"""
+        """Write PID to file atomically (temp file + fsync + rename)"""
         pid_file = self._get_pid_file(service_id)
-        with open(pid_file, 'w') as f:
-            f.write(str(pid))
+        tmp = pid_file.with_suffix('.pid.tmp')
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, str(pid).encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # A crash leaves either the old PID file or the new one, never a torn one
+        os.replace(tmp, pid_file)
 
     def _remove_pid(self, service_id: str):
         """Remove PID file"""
@@ -114,25 +196,75 @@ class ServiceManager:
             pid_file.unlink()
 
     def _is_process_running(self, pid: int) -> bool:
-        """Check if a process is running"""
+        """Check if a process is running (signal 0 probe, no /proc parsing)"""
+        if pid <= 0:
+            # kill() on 0 or a negative pid would target a process group
+            return False
         try:
-            process = psutil.Process(pid)
-            return process.is_running()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
             return False
+        except PermissionError:
+            # Exists but owned by another user
+            return True
 
-    def _check_health(self, service_id: str) -> Tuple[bool, str]:
+    def _check_health(
+        self,
+        service_id: str,
+        max_age: float = HEALTH_CACHE_TTL,
+        block: bool = True
+    ) -> Tuple[bool, str]:
+        """
+        Check service health, reusing a recent result.
+
+        At most one probe per service is in flight. The cache timestamp is
+        taken when the probe finishes, so slow endpoints are not re-probed
+        back to back by fast pollers.
+
+        Args:
+            service_id: Service to check
+            max_age: Reuse a cached result younger than this (0 forces a probe)
+            block: If False and a probe is already running, return the stale
+                result instead of waiting for it
+        """
+        cached = self._health_cache.get(service_id)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        lock = self._health_locks.setdefault(service_id, threading.Lock())
+        if not lock.acquire(blocking=block):
+            if cached:
+                return cached[1]
+            lock.acquire()
+        try:
+            # Another caller may have finished a probe while we waited
+            cached = self._health_cache.get(service_id)
+            if cached and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+            result = self._probe_health(service_id)
+            self._health_cache[service_id] = (time.monotonic(), result)
+            return result
+        finally:
+            lock.release()
+
+    def _probe_health(self, service_id: str) -> Tuple[bool, str]:
         """Check service health via HTTP endpoint"""
         config = self.services[service_id]
         try:
-            response = requests.get(
+            # Only the status line matters; stream and close without reading the body
+            response = self._session.request(
+                config.get('health_method', 'GET'),
                 config['health_endpoint'],
-                timeout=5
+                timeout=HEALTH_TIMEOUT,
+                stream=True
             )
-            if response.status_code == 200:
+            code = response.status_code
+            response.close()
+            if code == 200:
                 return True, "healthy"
             else:
-                return False, f"HTTP {response.status_code}"
+                return False, f"HTTP {code}"
         except requests.exceptions.ConnectionError:
             return False, "connection refused"
         except requests.exceptions.Timeout:
@@ -140,8 +272,19 @@ class ServiceManager:
         except Exception as e:
             return False, f"error: {str(e)}"
 
-    def get_status(self, service_id: str) -> Dict:
-        """Get detailed status of a service"""
+    def get_status(
+        self,
+        service_id: str,
+        proc_stats: Optional[Dict[int, ProcStat]] = None
+    ) -> Dict:
+        """
+        Get detailed status of a service
+
+        Args:
+            service_id: Service to inspect
+            proc_stats: Optional pid -> ProcStat map already gathered with
+                _collect_proc_stats(); pids missing from it are read directly
+        """
         config = self.services[service_id]
         pid = self._read_pid(service_id)
 
@@ -159,17 +302,33 @@ class ServiceManager:
         if pid and self._is_process_running(pid):
             status['running'] = True
 
-            # Get process info
+            # Uptime and memory straight from /proc when available
+            stat = proc_stats.get(pid) if proc_stats else None
+            if stat is None and _PROC_AVAILABLE:
+                stat = _read_proc_stat(pid)
+            if stat is not None:
+                started = psutil.boot_time() + stat.starttime / _CLK_TCK
+                status['uptime'] = time.time() - started
+                status['memory_mb'] = stat.rss * _PAGE_SIZE / 1024 / 1024
+
+            # Get process info (one cached psutil handle per service)
             try:
-                process = psutil.Process(pid)
-                status['uptime'] = time.time() - process.create_time()
-                status['memory_mb'] = process.memory_info().rss / 1024 / 1024
-                status['cpu_percent'] = process.cpu_percent(interval=0.1)
+                process = self._proc_cache.get(service_id)
+                first_sample = process is None or process.pid != pid
+                if first_sample:
+                    process = self._proc_cache[service_id] = psutil.Process(pid)
+                if stat is None:
+                    status['uptime'] = time.time() - process.create_time()
+                    status['memory_mb'] = process.memory_info().rss / 1024 / 1024
+                # Non-blocking: CPU use since the previous call; the first
+                # call only sets the baseline, so report None for it
+                cpu = process.cpu_percent(interval=None)
+                status['cpu_percent'] = None if first_sample else cpu
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+                self._proc_cache.pop(service_id, None)
 
-            # Check health
-            healthy, message = self._check_health(service_id)
+            # Check health (don't queue behind a probe that is already running)
+            healthy, message = self._check_health(service_id, block=False)
             status['healthy'] = healthy
             status['health_message'] = message
         else:
@@ -183,6 +342,24 @@ class ServiceManager:
         """Start a service"""
         config = self.services[service_id]
 
+        # Serialize concurrent starts of the same service, across processes too
+        lock_file = self._get_pid_file(service_id).with_suffix('.lock')
+        lock_fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if verbose:
+                    print(f"Service {config['name']} is already being started")
+                return False
+            return self._start_service(service_id, verbose)
+        finally:
+            os.close(lock_fd)  # releases the flock
+
+    def _start_service(self, service_id: str, verbose: bool) -> bool:
+        """Start a service (caller holds the start lock)"""
+        config = self.services[service_id]
+
         # Check if already running
         pid = self._read_pid(service_id)
         if pid and self._is_process_running(pid):
@@ -203,13 +380,19 @@ class ServiceManager:
                 log.write(f"Starting {config['name']} at {datetime.now().isoformat()}\n")
                 log.write(f"{'='*60}\n\n")
 
+                # Popen already launches via vfork() on CPython 3.10+ as long as
+                # no preexec_fn/user/group is given; keep it that way. (posix_spawn
+                # can't set cwd, and we want Popen.poll() for the startup check.)
                 process = subprocess.Popen(
                     [sys.executable, config['script']],
                     cwd=config['working_dir'],
+                    # The child writes straight to the log file. Don't relay
+                    # through a pipe: the service must outlive this CLI process.
                     stdout=log,
                     stderr=subprocess.STDOUT,
                     start_new_session=True,
-                    env=os.environ.copy()
+                    # None inherits our environment without copying it
+                    env=None
                 )
 
             # Write PID
@@ -220,19 +403,20 @@ class ServiceManager:
                 print(f"   Process started with PID {process.pid}")
                 print(f"   Waiting for service to be ready (timeout: {config['start_timeout']}s)...")
 
-            start_time = time.time()
-            while time.time() - start_time < config['start_timeout']:
-                time.sleep(1)
-
-                # Check if process is still running
-                if not self._is_process_running(process.pid):
+            # Probe on an exponential schedule (10ms, 20ms, ... capped at 500ms)
+            # so fast services are detected quickly without hammering slow ones
+            deadline = time.monotonic() + config['start_timeout']
+            delay = 0.01
+            while time.monotonic() < deadline:
+                # Check if process is still running (poll() also reaps a crashed child)
+                if process.poll() is not None:
                     if verbose:
                         print(f"   Process died during startup")
                         print(f"   Check logs: {log_file}")
                     return False
 
-                # Check health
-                healthy, message = self._check_health(service_id)
+                # Check health (always a fresh probe while starting up)
+                healthy, message = self._check_health(service_id, max_age=0)
                 if healthy:
                     if verbose:
                         print(f"   {config['name']} started successfully!")
@@ -240,6 +424,9 @@ class ServiceManager:
                         print(f"   Logs: {log_file}")
                     return True
 
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
             # Timeout
             if verbose:
                 print(f"   Service started but health check timeout")
@@ -306,19 +493,96 @@ class ServiceManager:
         if verbose:
             print(f"Restarting {config['name']}...")
 
+        # stop_service returns only after wait() has seen the process exit, so
+        # no settle delay is needed. Services should bind with SO_REUSEADDR
+        # (Flask/werkzeug and uvicorn do) so a TIME_WAIT port doesn't block them.
         self.stop_service(service_id, verbose=False)
-        time.sleep(2)  # Give it a moment to fully shut down
         return self.start_service(service_id, verbose=verbose)
 
+    def run_supervisor(
+        self,
+        interval: float = 5,
+        base: float = 1,
+        cap: float = 60,
+        verbose: bool = True
+    ):
+        """
+        Watch all services and restart failed ones with exponential backoff.
+
+        A single loop pops the next due service from a min-heap of
+        (next_check_time, service_id) and sleeps until it is due, so one
+        thread supervises any number of services. Failing services are
+        rechecked after min(cap, base * 2**failures) seconds and restarted at
+        most once per backoff window, which stops restart storms on
+        flapping services. Supervisor start counts as a restart, and no
+        service is restarted sooner than its start_timeout after one, so a
+        service that is still starting up isn't killed in a loop. Runs until
+        interrupted (Ctrl+C).
+
+        Args:
+            interval: Seconds between checks of a healthy service
+            base: Initial backoff in seconds
+            cap: Maximum backoff in seconds
+            verbose: Print restarts
+        """
+        now = time.monotonic()
+        heap = [(now, service_id) for service_id in self.services]
+        heapq.heapify(heap)
+        last_restart: Dict[str, float] = {service_id: now for service_id in self.services}
+
+        try:
+            while heap:
+                due, service_id = heap[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                    continue
+                heapq.heappop(heap)
+
+                status = self.get_status(service_id)
+                now = time.monotonic()
+                if status['running'] and status['healthy']:
+                    self._failures[service_id] = 0
+                    heapq.heappush(heap, (now + interval, service_id))
+                    continue
+
+                failures = self._failures.get(service_id, 0) + 1
+                self._failures[service_id] = failures
+                backoff = min(cap, base * 2 ** min(failures, 32))
+                grace = self.services[service_id].get('start_timeout', 0)
+                if now - last_restart[service_id] >= max(backoff, grace):
+                    if verbose:
+                        print(f"{status['name']} unhealthy ({status['health_message']}), "
+                              f"restarting (failure {failures}, backoff {backoff:.0f}s)")
+                    self.restart_service(service_id, verbose=verbose)
+                    last_restart[service_id] = time.monotonic()
+                heapq.heappush(heap, (time.monotonic() + backoff, service_id))
+        except KeyboardInterrupt:
+            if verbose:
+                print("Supervisor stopped")
+
     def status_all(self):
         """Show status of all services"""
         print("Service Status Dashboard")
         print("=" * 80)
         print()
 
+        # Checks run concurrently, so the wait is the slowest service, not the sum
+        service_ids = list(self.services)
         statuses = {}
-        for service_id in self.services:
-            statuses[service_id] = self.get_status(service_id)
+        if service_ids:
+            # Read every service's /proc stat in one pass up front
+            proc_stats = {}
+            if _PROC_AVAILABLE:
+                pids = [self._read_pid(service_id) for service_id in service_ids]
+                proc_stats = _collect_proc_stats([pid for pid in pids if pid])
+
+            with ThreadPoolExecutor(max_workers=min(32, len(service_ids))) as executor:
+                results = executor.map(
+                    lambda service_id: self.get_status(service_id, proc_stats),
+                    service_ids
+                )
+                statuses = dict(zip(service_ids, results))
 
         # Display table
         print(f"{'SERVICE':<20} {'PORT':<8} {'STATUS':<12} {'PID':<10} {'HEALTH':<15}")
@@ -347,7 +611,7 @@ if __name__ == '__main__':
     import argparse
 
     parser = argparse.ArgumentParser(description='Service Manager')
-    parser.add_argument('command', choices=['start', 'stop', 'restart', 'status'])
+    parser.add_argument('command', choices=['start', 'stop', 'restart', 'status', 'supervise'])
     parser.add_argument('service', nargs='?', choices=list(SERVICES.keys()))
     parser.add_argument('--all', action='store_true', help='Apply to all services')
 
@@ -357,6 +621,8 @@ if __name__ == '__main__':
 
     if args.command == 'status':
         manager.status_all()
+    elif args.command == 'supervise':
+        manager.run_supervisor()
     elif args.service:
         if args.command == 'start':
             manager.start_service(args.service)
@@ -365,13 +631,17 @@ if __name__ == '__main__':
         elif args.command == 'restart':
             manager.restart_service(args.service)
     elif args.all:
-        for service_id in SERVICES:
-            if args.command == 'start':
-                manager.start_service(service_id)
-            elif args.command == 'stop':
-                manager.stop_service(service_id)
-            elif args.command == 'restart':
-                manager.restart_service(service_id)
+        # Act on all services at once, so --all takes as long as the slowest
+        # startup rather than the sum; per-service output is collected quietly
+        # and summarized afterwards instead of interleaving
+        action = getattr(manager, f'{args.command}_service')
+        service_ids = list(SERVICES)
+        with ThreadPoolExecutor(max_workers=max(1, len(service_ids))) as executor:
+            results = list(executor.map(lambda sid: action(sid, verbose=False), service_ids))
+        for service_id, ok in zip(service_ids, results):
+            print(f"{SERVICES[service_id]['name']}: {args.command} {'ok' if ok else 'failed'}")
+        print()
+        manager.status_all()
     else:
         parser.error(f"{args.command} requires either a service name or --all flag")
 
@@ -396,4 +666,7 @@ python service_manager.py start --all
 
 # Stop all services
 python service_manager.py stop --all
+
+# Keep all services up, restarting failures with backoff
+python service_manager.py supervise
 """
@@ -0,0 +1,258 @@
+"""
+ASGI Socket.IO Real-Time Broadcasting Pattern (Quart + python-socketio)
+
+Description: asyncio-native port of flask_socketio_broadcaster.py. A python-socketio
+AsyncServer is mounted in front of a Quart app and served by Uvicorn, so connections,
+broadcasts and the periodic generator all run as coroutines on one event loop instead
+of one thread (or greenlet) per client.
+
+Use Cases:
+- Real-time dashboards with many concurrent subscribers
+- Live notifications and alerts
+- Fan-out of streaming data to browser clients
+- Dashboards that also call other asyncio services (HTTP APIs, queues)
+
+Dependencies:
+- python-socketio (pip install python-socketio)
+- Quart (pip install quart)
+- Uvicorn (pip install uvicorn; add uvloop for a faster event loop)
+
+Notes:
+- Same events, rooms and HTTP endpoints as flask_socketio_broadcaster.py, and
+  compatible with the same Socket.IO JavaScript client
+- Handlers receive (sid, environ/data) instead of reading flask.request.sid
+- All emits are coroutines: always `await sio.emit(...)`
+- Run a single worker (rooms and client sets live in process memory); scale out
+  with a message queue via socketio.AsyncRedisManager
+- Run: uvicorn asgi_socketio_broadcaster:asgi_app --workers 1 --loop uvloop
+
+Related Snippets:
+- real-time-dashboards/flask_socketio_broadcaster.py
+- async-patterns/asyncio_background_thread.py
+- web-frameworks/gunicorn_socketio_deployment.py
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import socketio
+from quart import Quart, jsonify, render_template, request
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Socket.IO server (handles /socket.io/) in front of the Quart app (everything else)
+sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*')
+app = Quart(__name__)
+asgi_app = socketio.ASGIApp(sio, app)
+
+# Above this many clients, broadcasts to everyone are sent in chunks
+BROADCAST_BATCH_SIZE = 50
+
+
+class DataBroadcaster:
+    """Manages broadcasting data to connected Socket.IO clients."""
+
+    def __init__(self, sio: socketio.AsyncServer):
+        self.sio = sio
+        self.active_clients = set()
+        self.rooms = {}  # room_name -> set of client_ids
+
+    async def broadcast_event(self, event_name: str, data: Dict[str, Any], room: Optional[str] = None):
+        """Broadcast an event to all clients or a specific room.
+
+        Args:
+            event_name: Name of the Socket.IO event
+            data: Dictionary of data to send
+            room: Optional room name to broadcast to specific clients
+        """
+        if room is None and len(self.active_clients) > BROADCAST_BATCH_SIZE:
+            await self.broadcast_batched(event_name, data)
+            return
+        await self.sio.emit(event_name, data, room=room)
+        logger.debug(f"Broadcast {event_name} to {room or 'all'}: {data}")
+
+    async def broadcast_batched(self, event_name: str, data: Dict[str, Any],
+                                batch_size: int = BROADCAST_BATCH_SIZE):
+        """Broadcast to all clients in chunks, yielding the event loop between them.
+
+        Args:
+            event_name: Name of the Socket.IO event
+            data: Dictionary of data to send
+            batch_size: Clients per emit
+        """
+        sids = list(self.active_clients)
+        for start in range(0, len(sids), batch_size):
+            # A list of sids is encoded once and sent to each of them
+            await self.sio.emit(event_name, data, to=sids[start:start + batch_size])
+            await asyncio.sleep(0)
+        logger.debug(f"Broadcast {event_name} to {len(sids)} clients in batches of {batch_size}")
+
+    async def broadcast_to_all(self, event_name: str, data: Dict[str, Any]):
+        """Convenience method to broadcast to all connected clients."""
+        await self.broadcast_event(event_name, data)
+
+    def get_client_count(self) -> int:
+        """Get the number of active clients."""
+        return len(self.active_clients)
+
+
+# Global broadcaster instance
+broadcaster = DataBroadcaster(sio)
+
+
+# Socket.IO Event Handlers
+@sio.event
+async def connect(sid, environ):
+    """Handle client connection."""
+    broadcaster.active_clients.add(sid)
+    logger.info(f'Client connected: {sid} (total: {broadcaster.get_client_count()})')
+
+    # Send initial connection response
+    await sio.emit('connection_response', {
+        'status': 'connected',
+        'client_id': sid,
+        'timestamp': time.time()
+    }, to=sid)
+
+
+@sio.event
+async def disconnect(sid):
+    """Handle client disconnection."""
+    broadcaster.active_clients.discard(sid)
+
+    # Remove from all rooms (no other coroutine runs between these steps)
+    for room_name, clients in list(broadcaster.rooms.items()):
+        clients.discard(sid)
+        if not clients:
+            del broadcaster.rooms[room_name]
+
+    logger.info(f'Client disconnected: {sid} (total: {broadcaster.get_client_count()})')
+
+
+@sio.event
+async def join(sid, data):
+    """Handle client joining a room.
+
+    Args:
+        data: Dict with 'room' key specifying room name
+    """
+    room = data.get('room')
+    if room:
+        await sio.enter_room(sid, room)
+        broadcaster.rooms.setdefault(room, set()).add(sid)
+
+        logger.info(f'Client {sid} joined room: {room}')
+        await sio.emit('room_joined', {'room': room, 'status': 'success'}, to=sid)
+
+
+@sio.event
+async def leave(sid, data):
+    """Handle client leaving a room.
+
+    Args:
+        data: Dict with 'room' key specifying room name
+    """
+    room = data.get('room')
+    if room:
+        await sio.leave_room(sid, room)
+
+        if room in broadcaster.rooms:
+            broadcaster.rooms[room].discard(sid)
+            if not broadcaster.rooms[room]:
+                del broadcaster.rooms[room]
+
+        logger.info(f'Client {sid} left room: {room}')
+        await sio.emit('room_left', {'room': room, 'status': 'success'}, to=sid)
+
+
+@sio.event
+async def message(sid, data):
+    """Handle custom messages from clients.
+
+    Args:
+        data: Message data from client
+    """
+    logger.info(f'Received message from {sid}: {data}')
+    # Echo back or process as needed
+    await sio.emit('message_received', {'status': 'received', 'original': data}, to=sid)
+
+
+# Quart HTTP Routes
+@app.route('/')
+async def index():
+    """Render main page."""
+    return await render_template('index.html')
+
+
+@app.route('/api/broadcast', methods=['POST'])
+async def trigger_broadcast():
+    """HTTP endpoint to trigger a broadcast (for testing or external triggers).
+
+    Request Body:
+        event (str): Event name
+        data (dict): Data to broadcast
+        room (str, optional): Room to broadcast to
+    """
+    payload = await request.get_json()
+    event_name = payload.get('event', 'update')
+    data = payload.get('data', {})
+    room = payload.get('room')
+
+    await broadcaster.broadcast_event(event_name, data, room)
+
+    return jsonify({
+        'status': 'broadcasted',
+        'event': event_name,
+        'clients': broadcaster.get_client_count()
+    })
+
+
+@app.route('/api/stats')
+async def get_stats():
+    """Get current connection statistics."""
+    return jsonify({
+        'active_clients': broadcaster.get_client_count(),
+        'rooms': {name: len(clients) for name, clients in broadcaster.rooms.items()}
+    })
+
+
+# Example: Background task broadcasting periodic updates
+async def background_data_generator():
+    """Example background task that broadcasts data periodically."""
+    counter = 0
+    while True:
+        await asyncio.sleep(5)  # Update every 5 seconds
+        counter += 1
+
+        # Broadcast update to all clients
+        await broadcaster.broadcast_to_all('periodic_update', {
+            'counter': counter,
+            'timestamp': time.time(),
+            'message': f'Update #{counter}'
+        })
+
+        logger.info(f'Broadcasted periodic update #{counter}')
+
+
+# Start background task (optional)
+async def start_background_tasks():
+    """Start background tasks for data generation once the event loop is running."""
+    sio.start_background_task(background_data_generator)
+    logger.info("Background data generator started")
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    # Optionally start background tasks
+    # app.before_serving(start_background_tasks)
+
+    logger.info("Starting ASGI Socket.IO server")
+    logger.info("Navigate to http://localhost:5000")
+
+    # Equivalent to: uvicorn asgi_socketio_broadcaster:asgi_app --workers 1 --loop uvloop
+    uvicorn.run(asgi_app, host='0.0.0.0', port=5000, workers=1)
@@ -21,16 +21,30 @@ Notes:
 - For complex operations, add threading.Lock()
 - Efficient memory usage with bounded buffers
 - Suitable for high-frequency updates
+- Timestamps are stored as time.time_ns() ints; datetimes are built only on read
+- Pass schema=(...) to also keep per-field columns for filter_col/filter_val lookups
+- Breaking change: SimpleDashboardState.sentiment_history is no longer a deque.
+  It is a property returning a read-only tuple of dicts (append() raises
+  AttributeError); record points with add_history_point(), or assign a list
+  of {'timestamp', 'positive', 'negative', 'neutral'} dicts to replace it
+- With enable_locking=True, counter updates are batched per thread and published
+  copy-on-write; get_counter reads lock-free (published value plus every
+  thread's pending delta for that key), get_stats_snapshot publishes pending
+  batches first, so reads never miss updates from idle writer threads
 
 Related Snippets:
 - real-time-dashboards/socketio_emit_from_background.py
 - data-visualization/time_series_buffer.py
 """
 
-from collections import deque
+from array import array
+from collections import Counter, deque
+from itertools import compress, islice, repeat
+import operator
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import threading
+import time
 
 
 class DashboardState:
@@ -61,7 +75,8 @@ class DashboardState:
         self,
         buffer_size: int = 500,
         history_size: int = 60,
-        enable_locking: bool = False
+        enable_locking: bool = False,
+        schema: Optional[tuple] = None
     ):
         """
         Initialize dashboard state.
@@ -70,24 +85,42 @@ class DashboardState:
             buffer_size: Maximum items to buffer
             history_size: Maximum historical data points to keep
             enable_locking: Enable thread locking for complex operations
+            schema: Optional field names to also store column-wise, enabling
+                fast equality filters via get_recent_items(filter_col=...)
         """
         # Circular buffer for recent items
         self.items_buffer = deque(maxlen=buffer_size)
 
-        # Counters
-        self.counters = {}
+        # Optional column store, kept index-aligned with items_buffer
+        self.schema = tuple(schema) if schema else ()
+        self._cols = {name: deque(maxlen=buffer_size) for name in self.schema}
+        # Keeps concurrent add_item calls from interleaving buffer/column appends
+        self._cols_lock = threading.Lock() if self.schema else None
+
+        # Counters (missing keys read as 0, so += is a single lookup)
+        self.counters = Counter()
 
         # Time-series history
         self.history = deque(maxlen=history_size)
 
         # Metadata
         self.total_processed = 0
-        self.start_time = datetime.now()
-        self.last_update = datetime.now()
+        self._start_ns = time.time_ns()
+        self._last_update_ns = self._start_ns
 
         # Optional thread lock
         self._lock = threading.Lock() if enable_locking else None
 
+        # Locking mode: per-thread pending counter deltas, plus a registry of
+        # (thread, batch_lock, pending) so readers, resets and flushes can
+        # reach every thread's batch, including those of idle or exited threads
+        self._local = threading.local()
+        self._writers: List[tuple] = []
+
+        # Odd while pending deltas are being moved into self.counters, bumped
+        # twice per publish; lock-free readers retry if it changed under them
+        self._seq = 0
+
     def add_item(self, item: Dict[str, Any]):
         """
         Add item to buffer.
@@ -95,9 +128,30 @@ class DashboardState:
         Args:
             item: Dict with item data
         """
-        self.items_buffer.append(item)
+        if self._cols_lock is None:
+            self.items_buffer.append(item)
+        else:
+            with self._cols_lock:
+                self.items_buffer.append(item)
+                for name, column in self._cols.items():
+                    column.append(item.get(name))
         self.total_processed += 1
-        self.last_update = datetime.now()
+        self._last_update_ns = time.time_ns()
+
+    @property
+    def start_time(self) -> datetime:
+        """When the state was created or last reset"""
+        return datetime.fromtimestamp(self._start_ns / 1e9)
+
+    @property
+    def last_update(self) -> datetime:
+        """When the most recent item was added"""
+        return datetime.fromtimestamp(self._last_update_ns / 1e9)
+
+    # Locking mode: flush a thread's pending deltas after this many updates
+    # or this many seconds, whichever comes first
+    flush_every = 64
+    flush_interval = 0.05
 
     def increment_counter(self, key: str, amount: int = 1):
         """
@@ -107,23 +161,120 @@ class DashboardState:
             key: Counter name
             amount: Amount to increment (default: 1)
         """
-        if key not in self.counters:
-            self.counters[key] = 0
-        self.counters[key] += amount
+        if self._lock is None:
+            self.counters[key] += amount
+            return
+        batch_lock, pending = self._pending()
+        with batch_lock:
+            pending[key] += amount
+        self._maybe_flush()
 
     def decrement_counter(self, key: str, amount: int = 1):
         """Decrement a named counter"""
-        if key not in self.counters:
-            self.counters[key] = 0
-        self.counters[key] -= amount
+        if self._lock is None:
+            self.counters[key] -= amount
+            return
+        batch_lock, pending = self._pending()
+        with batch_lock:
+            pending[key] -= amount
+        self._maybe_flush()
 
     def set_counter(self, key: str, value: int):
         """Set counter to specific value"""
-        self.counters[key] = value
+        if self._lock is None:
+            self.counters[key] = value
+            return
+        with self._lock:
+            self._seq += 1
+            try:
+                counters = Counter(self.counters)
+                self._merge_pending(counters)
+                counters[key] = value
+                self.counters = counters
+            finally:
+                self._seq += 1
 
     def get_counter(self, key: str) -> int:
         """Get current counter value"""
-        return self.counters.get(key, 0)
+        if self._lock is None:
+            return self.counters.get(key, 0)
+
+        # Locking mode: published value plus every thread's unpublished delta,
+        # without taking the lock or republishing; retry if a publish ran
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)
+                continue
+            value = self.counters.get(key, 0)
+            for _, _, pending in self._writers:
+                value += pending.get(key, 0)
+            if self._seq == seq:
+                return value
+
+    def _pending(self) -> tuple:
+        """This thread's (batch_lock, pending) batch of unpublished counter deltas"""
+        local = self._local
+        try:
+            return local.batch
+        except AttributeError:
+            local.batch = (threading.Lock(), Counter())
+            local.ops = 0
+            local.flush_at = time.monotonic() + self.flush_interval
+            with self._lock:
+                self._writers.append((threading.current_thread(),) + local.batch)
+            return local.batch
+
+    def _merge_pending(self, counters: Optional[Counter]):
+        """
+        Drain every registered batch into counters (None discards them).
+
+        Must be called with self._lock held. Each batch is drained under its
+        own lock, so its owner thread never loses a concurrent update.
+        Batches of threads that have exited are unregistered once drained.
+        """
+        alive = []
+        for thread, batch_lock, pending in self._writers:
+            with batch_lock:
+                if counters is not None:
+                    counters.update(pending)
+                pending.clear()
+            if thread.is_alive():
+                alive.append((thread, batch_lock, pending))
+        self._writers = alive
+
+    def _maybe_flush(self):
+        """Flush this thread's batch once it is big or old enough"""
+        local = self._local
+        local.ops += 1
+        if local.ops >= self.flush_every or time.monotonic() >= local.flush_at:
+            self.flush_counters()
+
+    def flush_counters(self):
+        """
+        Publish every thread's pending counter updates (locking mode only).
+
+        Pending deltas are merged into a copy and the reference is swapped,
+        so anyone holding self.counters sees a complete, never-mutated dict.
+        Nothing is copied when no thread has pending deltas. Call this from
+        a broadcast tick to bound how stale self.counters can get when it
+        is read directly.
+        """
+        if self._lock is None:
+            return
+        with self._lock:
+            if any(pending for _, _, pending in self._writers):
+                self._seq += 1
+                try:
+                    counters = Counter(self.counters)
+                    self._merge_pending(counters)
+                    self.counters = counters
+                finally:
+                    self._seq += 1
+        local = self._local
+        if hasattr(local, 'batch'):
+            local.ops = 0
+            local.flush_at = time.monotonic() + self.flush_interval
 
     def add_history_point(self, data: Dict[str, Any]):
         """
@@ -139,7 +290,9 @@ class DashboardState:
     def get_recent_items(
         self,
         limit: int = 50,
-        filter_func: Optional[callable] = None
+        filter_func: Optional[callable] = None,
+        filter_col: Optional[str] = None,
+        filter_val: Any = None
     ) -> List[Dict[str, Any]]:
         """
         Get recent items from buffer.
@@ -147,16 +300,29 @@ class DashboardState:
         Args:
             limit: Maximum items to return
             filter_func: Optional function to filter items
+            filter_col: Optional field that must equal filter_val; uses the
+                column store when the field is in the schema
+            filter_val: Value to match against filter_col
 
         Returns:
             List of recent items (newest first)
         """
-        items = list(self.items_buffer)
-
-        if filter_func:
-            items = [item for item in items if filter_func(item)]
-
-        return items[-limit:][::-1]  # Return newest first
+        if limit <= 0:
+            return []
+
+        if filter_col is not None:
+            if filter_col in self._cols:
+                # Compare the column newest-first and stop after `limit` hits,
+                # without touching item dicts or calling back into Python
+                with self._cols_lock:
+                    matches = map(operator.eq, reversed(self._cols[filter_col]), repeat(filter_val))
+                    return list(islice(compress(reversed(self.items_buffer), matches), limit))
+            filter_func = lambda item: item.get(filter_col) == filter_val
+
+        # Walk newest-first and stop at `limit`, instead of copying the buffer
+        if filter_func is None:
+            return list(islice(reversed(self.items_buffer), limit))
+        return list(islice(filter(filter_func, reversed(self.items_buffer)), limit))
 
     def get_history(self, limit: int = None) -> List[Dict[str, Any]]:
         """
@@ -180,10 +346,15 @@ class DashboardState:
         Returns:
             Dict with all current statistics
         """
-        uptime = (datetime.now() - self.start_time).total_seconds()
+        uptime = (time.time_ns() - self._start_ns) / 1e9
+
+        # Locking mode: publish every thread's batch, then take the current
+        # counters by reference; published dicts are never mutated
+        self.flush_counters()
+        counters = self.counters
 
         return {
-            'counters': dict(self.counters),
+            'counters': dict(counters),
             'total_processed': self.total_processed,
             'buffer_size': len(self.items_buffer),
             'history_size': len(self.history),
@@ -195,20 +366,36 @@ class DashboardState:
 
     def reset_counters(self):
         """Reset all counters to zero"""
-        self.counters = {}
+        if self._lock is not None:
+            # Discard every thread's unpublished deltas along with the totals
+            with self._lock:
+                self._seq += 1
+                try:
+                    self._merge_pending(None)
+                    self.counters = Counter()
+                finally:
+                    self._seq += 1
+        else:
+            self.counters = Counter()
         self.total_processed = 0
 
     def clear_buffers(self):
         """Clear all buffers and history"""
-        self.items_buffer.clear()
+        if self._cols_lock is None:
+            self.items_buffer.clear()
+        else:
+            with self._cols_lock:
+                self.items_buffer.clear()
+                for column in self._cols.values():
+                    column.clear()
         self.history.clear()
 
     def reset_all(self):
         """Reset all state"""
         self.reset_counters()
         self.clear_buffers()
-        self.start_time = datetime.now()
-        self.last_update = datetime.now()
+        self._start_ns = time.time_ns()
+        self._last_update_ns = self._start_ns
 
 
 # Simplified pattern from Bluesky dashboard
@@ -225,14 +412,23 @@ class SimpleDashboardState:
         recent_posts = list(state.posts_buffer)
     """
 
-    def __init__(self):
+    def __init__(self, history_size: int = 60):
         self.posts_buffer = deque(maxlen=500)
         self.sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
         self.posts_per_minute = 0
         self.keyword_filters = []
         self.running = False
         self.total_processed = 0
-        self.sentiment_history = deque(maxlen=60)  # Last 60 seconds
+
+        # Sentiment history as packed ring buffers (default: last 60 seconds);
+        # 32 bytes per point instead of a dict of boxed values
+        self._history_cap = history_size
+        self._hist_ts = array('d', [0.0]) * history_size
+        self._hist_pos = array('q', [0]) * history_size
+        self._hist_neg = array('q', [0]) * history_size
+        self._hist_neu = array('q', [0]) * history_size
+        self._hist_head = 0
+        self._hist_len = 0
 
     def add_post(self, post_data: Dict[str, Any]):
         """Add post to buffer"""
@@ -246,19 +442,98 @@ class SimpleDashboardState:
 
     def add_history_point(self):
         """Add current state to history"""
-        self.sentiment_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'positive': self.sentiment_counts['positive'],
-            'negative': self.sentiment_counts['negative'],
-            'neutral': self.sentiment_counts['neutral']
-        })
+        if not self._history_cap:
+            return
+        counts = self.sentiment_counts
+        self._push_history(
+            time.time(), counts['positive'], counts['negative'], counts['neutral']
+        )
+
+    def _push_history(self, ts: float, positive: int, negative: int, neutral: int):
+        """Write one point into the ring buffers, overwriting the oldest"""
+        i = self._hist_head
+        self._hist_ts[i] = ts
+        self._hist_pos[i] = positive
+        self._hist_neg[i] = negative
+        self._hist_neu[i] = neutral
+        self._hist_head = (i + 1) % self._history_cap
+        if self._hist_len < self._history_cap:
+            self._hist_len += 1
+
+    def get_history_arrays(self) -> Dict[str, array]:
+        """
+        Get history as oldest-first numeric columns.
+
+        Returns:
+            Dict of 'timestamp' (epoch seconds), 'positive', 'negative' and
+            'neutral' arrays, ready for plotting or numpy.asarray()
+        """
+        n, head = self._hist_len, self._hist_head
+
+        def ordered(column: array) -> array:
+            if n < self._history_cap:
+                return column[:n]
+            return column[head:] + column[:head]
+
+        return {
+            'timestamp': ordered(self._hist_ts),
+            'positive': ordered(self._hist_pos),
+            'negative': ordered(self._hist_neg),
+            'neutral': ordered(self._hist_neu)
+        }
+
+    @property
+    def sentiment_history(self) -> tuple:
+        """
+        History as a tuple of dicts (oldest first), for JSON/Socket.IO payloads.
+
+        Built on each access from the ring buffers; it is a tuple so that
+        code still calling .append() on it fails instead of silently
+        appending to a throwaway copy. Use add_history_point() instead.
+        """
+        cols = self.get_history_arrays()
+        return tuple(
+            {
+                'timestamp': datetime.fromtimestamp(ts).isoformat(),
+                'positive': pos,
+                'negative': neg,
+                'neutral': neu
+            }
+            for ts, pos, neg, neu in zip(
+                cols['timestamp'], cols['positive'], cols['negative'], cols['neutral']
+            )
+        )
+
+    @sentiment_history.setter
+    def sentiment_history(self, points: List[Dict[str, Any]]):
+        """
+        Replace the history, keeping the newest history_size points.
+
+        Args:
+            points: Oldest-first dicts with 'positive', 'negative', 'neutral'
+                counts and a 'timestamp' (ISO string, datetime or epoch seconds)
+        """
+        self._hist_head = 0
+        self._hist_len = 0
+        if not self._history_cap:
+            return
+        for point in list(points)[-self._history_cap:]:
+            ts = point.get('timestamp', time.time())
+            if isinstance(ts, str):
+                ts = datetime.fromisoformat(ts)
+            if isinstance(ts, datetime):
+                ts = ts.timestamp()
+            self._push_history(
+                float(ts), point['positive'], point['negative'], point['neutral']
+            )
 
     def reset(self):
         """Reset all statistics"""
         self.sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
         self.total_processed = 0
         self.posts_buffer.clear()
-        self.sentiment_history.clear()
+        self._hist_head = 0
+        self._hist_len = 0
 
 
 if __name__ == "__main__":
@@ -314,4 +589,5 @@ if __name__ == "__main__":
     simple_state.add_history_point()
 
     print(f"\nSentiment counts: {simple_state.sentiment_counts}")
+    print(f"History: {simple_state.sentiment_history}")
     print(f"Total: {simple_state.total_processed}")
@@ -17,21 +17,45 @@ Dependencies:
 - Flask-SocketIO (pip install Flask-SocketIO)
 - Flask-CORS (pip install Flask-CORS)
 - python-socketio (pip install python-socketio)
+- eventlet (optional, default async mode: pip install eventlet)
+- gevent + gevent-websocket (optional alternative: pip install gevent gevent-websocket)
 
 Notes:
-- Uses async_mode='threading' for compatibility with standard Flask
-- For production, use async_mode='eventlet' with gunicorn --worker-class eventlet
+- Async mode comes from SOCKETIO_ASYNC_MODE (eventlet, gevent or threading);
+  defaults to eventlet and falls back to threading if it isn't installed
+- threading mode has poor performance and no native WebSocket transport
+  (clients fall back to long-polling); use it for local debugging only
+- For production: gunicorn --worker-class eventlet -w 1 --bind 0.0.0.0:5000 app:app
 - SocketIO.emit() can be called from any thread (thread-safe)
 - Namespace support allows organizing events by topic
 - Room support enables targeted broadcasting to subsets of clients
 - CORS configured for cross-origin requests
 
 Related Snippets:
+- real-time-dashboards/asgi_socketio_broadcaster.py (asyncio/ASGI port)
 - async-patterns/asyncio_background_thread.py
 - web-frameworks/flask_background_thread.py
 - real-time-dashboards/websocket_firehose_reconnection.py
 """
 
+import os
+
+# Choose the async backend before anything else is imported: eventlet and
+# gevent must monkey-patch the standard library (sockets, threading, time) first
+ASYNC_MODE = os.getenv('SOCKETIO_ASYNC_MODE', 'eventlet')
+if ASYNC_MODE == 'eventlet':
+    try:
+        import eventlet
+        eventlet.monkey_patch()
+    except ImportError:
+        ASYNC_MODE = 'threading'
+elif ASYNC_MODE == 'gevent':
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        ASYNC_MODE = 'threading'
+
 import logging
 import threading
 import time
@@ -51,8 +75,10 @@ app.config['SECRET_KEY'] = 'your-secret-key-change-this'
 CORS(app)
 
 # Initialize SocketIO
-# async_mode='threading' for development, 'eventlet' for production
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
+
+# Above this many clients, broadcasts to everyone are sent in chunks
+BROADCAST_BATCH_SIZE = 50
 
 
 class DataBroadcaster:
@@ -62,6 +88,9 @@ class DataBroadcaster:
         self.socketio = socketio
         self.active_clients = set()
         self.rooms = {}  # room_name -> set of client_ids
+        # Guards active_clients/rooms; handlers run on many threads and the
+        # room cleanup is check-then-act (unsafe without a GIL)
+        self._lock = threading.RLock()
 
     def broadcast_event(self, event_name: str, data: Dict[str, Any], room: str = None):
         """Broadcast an event to all clients or a specific room.
@@ -74,10 +103,33 @@ class DataBroadcaster:
         if room:
             self.socketio.emit(event_name, data, room=room)
             logger.debug(f"Broadcast {event_name} to room {room}: {data}")
+        elif len(self.active_clients) > BROADCAST_BATCH_SIZE:
+            self.broadcast_batched(event_name, data)
         else:
             self.socketio.emit(event_name, data)
             logger.debug(f"Broadcast {event_name} to all: {data}")
 
+    def broadcast_batched(self, event_name: str, data: Dict[str, Any],
+                          batch_size: int = BROADCAST_BATCH_SIZE):
+        """Broadcast to all clients in chunks, yielding between chunks.
+
+        One emit to every client queues all frames in a single step and
+        stalls other requests with hundreds of subscribers; chunking lets
+        the server flush frames and serve other work in between.
+
+        Args:
+            event_name: Name of the SocketIO event
+            data: Dictionary of data to send
+            batch_size: Clients per emit
+        """
+        with self._lock:
+            sids = list(self.active_clients)
+        for start in range(0, len(sids), batch_size):
+            # A list of sids is encoded once and sent to each of them
+            self.socketio.emit(event_name, data, to=sids[start:start + batch_size])
+            self.socketio.sleep(0)
+        logger.debug(f"Broadcast {event_name} to {len(sids)} clients in batches of {batch_size}")
+
     def broadcast_to_all(self, event_name: str, data: Dict[str, Any]):
         """Convenience method to broadcast to all connected clients."""
         self.broadcast_event(event_name, data)
@@ -96,7 +148,8 @@ broadcaster = DataBroadcaster(socketio)
 def handle_connect():
     """Handle client connection."""
     client_id = request.sid
-    broadcaster.active_clients.add(client_id)
+    with broadcaster._lock:
+        broadcaster.active_clients.add(client_id)
     logger.info(f'Client connected: {client_id} (total: {broadcaster.get_client_count()})')
 
     # Send initial connection response
@@ -111,13 +164,14 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection."""
     client_id = request.sid
-    broadcaster.active_clients.discard(client_id)
+    with broadcaster._lock:
+        broadcaster.active_clients.discard(client_id)
 
-    # Remove from all rooms
-    for room_name, clients in list(broadcaster.rooms.items()):
-        clients.discard(client_id)
-        if not clients:
-            del broadcaster.rooms[room_name]
+        # Remove from all rooms
+        for room_name, clients in list(broadcaster.rooms.items()):
+            clients.discard(client_id)
+            if not clients:
+                del broadcaster.rooms[room_name]
 
     logger.info(f'Client disconnected: {client_id} (total: {broadcaster.get_client_count()})')
 
@@ -134,9 +188,10 @@ def handle_join(data):
         join_room(room)
         client_id = request.sid
 
-        if room not in broadcaster.rooms:
-            broadcaster.rooms[room] = set()
-        broadcaster.rooms[room].add(client_id)
+        with broadcaster._lock:
+            if room not in broadcaster.rooms:
+                broadcaster.rooms[room] = set()
+            broadcaster.rooms[room].add(client_id)
 
         logger.info(f'Client {client_id} joined room: {room}')
         emit('room_joined', {'room': room, 'status': 'success'})
@@ -154,10 +209,11 @@ def handle_leave(data):
         leave_room(room)
         client_id = request.sid
 
-        if room in broadcaster.rooms:
-            broadcaster.rooms[room].discard(client_id)
-            if not broadcaster.rooms[room]:
-                del broadcaster.rooms[room]
+        with broadcaster._lock:
+            if room in broadcaster.rooms:
+                broadcaster.rooms[room].discard(client_id)
+                if not broadcaster.rooms[room]:
+                    del broadcaster.rooms[room]
 
         logger.info(f'Client {client_id} left room: {room}')
         emit('room_left', {'room': room, 'status': 'success'})
@@ -208,18 +264,20 @@ def trigger_broadcast():
 @app.route('/api/stats')
 def get_stats():
     """Get current connection statistics."""
+    with broadcaster._lock:
+        rooms = {name: len(clients) for name, clients in broadcaster.rooms.items()}
     return jsonify({
         'active_clients': broadcaster.get_client_count(),
-        'rooms': {name: len(clients) for name, clients in broadcaster.rooms.items()}
+        'rooms': rooms
     })
 
 
 # Example: Background thread broadcasting periodic updates
 def background_data_generator():
-    """Example background thread that broadcasts data periodically."""
+    """Example background task that broadcasts data periodically."""
     counter = 0
     while True:
-        time.sleep(5)  # Update every 5 seconds
+        socketio.sleep(5)  # Update every 5 seconds (yields under eventlet/gevent)
         counter += 1
 
         # Broadcast update to all clients
@@ -232,11 +290,11 @@ def background_data_generator():
         logger.info(f'Broadcasted periodic update #{counter}')
 
 
-# Start background thread (optional)
+# Start background task (optional)
 def start_background_tasks():
     """Start background tasks for data generation."""
-    thread = threading.Thread(target=background_data_generator, daemon=True)
-    thread.start()
+    # A greenlet under eventlet/gevent, a daemon thread under threading
+    socketio.start_background_task(background_data_generator)
     logger.info("Background data generator started")
 
 
@@ -244,7 +302,7 @@ if __name__ == '__main__':
     # Optionally start background tasks
     # start_background_tasks()
 
-    logger.info("Starting Flask-SocketIO server")
+    logger.info(f"Starting Flask-SocketIO server (async_mode={ASYNC_MODE})")
     logger.info("Navigate to http://localhost:5000")
 
     # For development
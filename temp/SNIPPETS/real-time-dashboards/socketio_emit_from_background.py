@@ -21,6 +21,8 @@ Notes:
 - Can broadcast to all clients or target specific rooms
 - Namespace defaults to '/' if not specified
 - Combine with deque for efficient buffering
+- BufferedEmitter coalesces queued events per (event, room) into one frame
+  carrying {'batch': [data, ...]}; clients should unpack the batch list
 
 Related Snippets:
 - async-patterns/asyncio_background_thread.py
@@ -31,7 +33,8 @@ Related Snippets:
 import threading
 import asyncio
 import logging
-from collections import deque
+import time
+from collections import defaultdict, deque
 from typing import Dict, Any
 from flask import Flask
 from flask_socketio import SocketIO
@@ -98,7 +101,10 @@ class RealtimeDataEmitter:
 
 class BufferedEmitter:
     """
-    Buffers events and emits periodically to reduce SocketIO overhead.
+    Buffers events and emits them in coalesced batches to reduce SocketIO overhead.
+
+    Events sharing (event, room) are sent as a single frame whose payload is
+    {'batch': [data, ...]}, so N queued events cost one frame per key.
 
     Example Usage:
         emitter = BufferedEmitter(socketio, flush_interval=1.0)
@@ -108,37 +114,77 @@ class BufferedEmitter:
         emitter.queue_event('metric', {'value': 1})
         emitter.queue_event('metric', {'value': 2})
 
-        # Events will be flushed every 1 second
+        # Within 1 second clients receive one 'metric' event:
+        # {'batch': [{'value': 1}, {'value': 2}]}
     """
 
     def __init__(
         self,
         socketio: SocketIO,
         flush_interval: float = 1.0,
-        namespace: str = '/'
+        namespace: str = '/',
+        max_batch_size: int = 500,
+        max_queued: int = 10_000
     ):
         """
         Initialize buffered emitter.
 
         Args:
             socketio: Flask-SocketIO instance
-            flush_interval: Seconds between flushes
+            flush_interval: Max seconds an event waits, counted from the first
+                event of the pending batch
             namespace: SocketIO namespace
+            max_batch_size: Flush early once any (event, room) batch holds
+                this many items, bounding frame size
+            max_queued: Most events held across all batches; beyond this the
+                oldest event of the same batch is dropped (lossy by design)
         """
         self.socketio = socketio
         self.namespace = namespace
         self.flush_interval = flush_interval
-        self.buffer = deque()
+        self.max_batch_size = max_batch_size
+        self.max_queued = max_queued
+        self.buffer = defaultdict(deque)  # (event, room) -> deque of data
+        self.queued = 0
+        self.dropped = 0
         self.running = False
         self.thread = None
 
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._first_event_at = None  # monotonic time the pending batch started
+        self._batch_full = False
+
     def queue_event(self, event: str, data: Dict[str, Any], room: str = None):
         """Add event to buffer"""
-        self.buffer.append({
-            'event': event,
-            'data': data,
-            'room': room
-        })
+        wake = False
+        with self._lock:
+            if self.queued >= self.max_queued:
+                # Producer is outrunning the flusher: keep memory bounded by
+                # dropping the oldest event of this batch (or this one)
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logger.warning(f"BufferedEmitter full, dropped {self.dropped} events so far")
+                bucket = self.buffer.get((event, room))
+                if not bucket:
+                    return
+                bucket.popleft()
+            else:
+                self.queued += 1
+                bucket = self.buffer[(event, room)]
+            bucket.append(data)
+            if self._first_event_at is None:
+                self._first_event_at = time.monotonic()
+                wake = True
+            if len(bucket) >= self.max_batch_size and not self._batch_full:
+                self._batch_full = True
+                wake = True
+        if wake:
+            self._wakeup.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and number of events dropped on overflow"""
+        return {'queued': self.queued, 'dropped': self.dropped}
 
     def start(self):
         """Start background flushing"""
@@ -153,29 +199,47 @@ class BufferedEmitter:
     def stop(self):
         """Stop background flushing"""
         self.running = False
+        self._wakeup.set()
         self._flush_buffer()  # Flush remaining events
         if self.thread:
             self.thread.join(timeout=5.0)
         logger.info("BufferedEmitter stopped")
 
     def _flush_loop(self):
-        """Background loop to flush buffer periodically"""
-        import time
-
+        """Background loop: flush flush_interval after a batch starts, or when one fills"""
         while self.running:
-            time.sleep(self.flush_interval)
+            with self._lock:
+                first, full = self._first_event_at, self._batch_full
+            if first is None:
+                timeout = None  # Idle until the next event arrives
+            elif full:
+                timeout = 0
+            else:
+                timeout = first + self.flush_interval - time.monotonic()
+
+            if timeout is None or timeout > 0:
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+                continue
             self._flush_buffer()
 
     def _flush_buffer(self):
-        """Emit all buffered events"""
-        while self.buffer:
-            event_data = self.buffer.popleft()
+        """Emit each (event, room) batch as one frame"""
+        with self._lock:
+            if not self.buffer:
+                return
+            batches, self.buffer = self.buffer, defaultdict(deque)
+            self.queued = 0
+            self._first_event_at = None
+            self._batch_full = False
+
+        for (event, room), items in batches.items():
             try:
                 self.socketio.emit(
-                    event_data['event'],
-                    event_data['data'],
+                    event,
+                    {'batch': list(items)},
                     namespace=self.namespace,
-                    room=event_data['room']
+                    room=room
                 )
             except Exception as e:
                 logger.error(f"Error flushing event: {e}")
@@ -255,7 +319,7 @@ if __name__ == "__main__":
     buffered.start()
 
     def fast_worker():
-        """Generate many events quickly - will be batched"""
+        """Generate many events quickly - sent as {'batch': [...]} frames"""
         for i in range(100):
             buffered.queue_event('fast_metric', {'value': i})
             time.sleep(0.01)
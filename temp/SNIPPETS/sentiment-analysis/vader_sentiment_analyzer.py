@@ -13,6 +13,7 @@ Use Cases:
 
 Dependencies:
 - vaderSentiment>=3.3.2
+- rust-vader (optional, native VADER port used by backend='auto'/'rust')
 
 Notes:
 - VADER is specifically tuned for social media text (Twitter, Facebook, etc.)
@@ -20,6 +21,16 @@ Notes:
 - Returns compound score: >= 0.05 (positive), <= -0.05 (negative), else neutral
 - Fast enough for real-time analysis (thousands of texts per second)
 - No training required - works out of the box
+- One SentimentIntensityAnalyzer (lexicon load) per backend is shared by all callers
+- backend='auto' prefers the native rust-vader port when installed; both
+  backends return the same pos/neg/neu/compound dicts
+- Texts are stripped and truncated to MAX_LEN (4096) characters before scoring;
+  empty ones short-circuit to neutral without calling VADER
+- Scores for the last 8192 distinct texts are memoized, so calling
+  analyze_batch, get_sentiment_distribution and get_average_sentiment on the
+  same texts scores each text once (with or without n_workers)
+- n_workers > 1 sends only memo misses to a process pool that is created on
+  first use and kept for later batches
 
 Related Snippets:
 - real-time-dashboards/sentiment_dashboard_state.py
@@ -27,11 +38,137 @@ Related Snippets:
 """
 
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Tuple, List
+import functools
 import logging
+import multiprocessing
+import threading
+
+try:
+    from rust_vader import SentimentIntensityAnalyzer as _RustVADER
+    RUST_VADER_AVAILABLE = True
+except ImportError:
+    _RustVADER = None
+    RUST_VADER_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Backend used when none is requested explicitly
+DEFAULT_BACKEND = 'rust' if RUST_VADER_AVAILABLE else 'python'
+
+
+def _resolve_backend(backend: str) -> str:
+    """
+    Turn 'auto'/'python'/'rust' into a concrete, importable backend.
+
+    Raises:
+        ImportError: If 'rust' is requested but rust-vader isn't installed
+        ValueError: If backend is unknown
+    """
+    if backend == 'auto':
+        return DEFAULT_BACKEND
+    if backend == 'rust' and not RUST_VADER_AVAILABLE:
+        raise ImportError("rust-vader required. Install with: pip install rust-vader")
+    if backend not in ('python', 'rust'):
+        raise ValueError(f"Unknown backend: {backend!r} (expected 'auto', 'python' or 'rust')")
+    return backend
+
+
+@functools.lru_cache(maxsize=None)
+def _get_analyzer(backend: str = DEFAULT_BACKEND):
+    """Shared analyzer per backend; the lexicon is loaded once, on first use"""
+    if backend == 'rust':
+        return _RustVADER()
+    return SentimentIntensityAnalyzer()
+
+
+# LRU memo of (text, backend) -> scores, shared by single and batch scoring;
+# an explicit dict rather than lru_cache so pool results can be stored too
+_SCORE_CACHE_SIZE = 8192
+_score_cache: 'OrderedDict[Tuple[str, str], Dict[str, float]]' = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+
+def _memo_get(text: str, backend: str):
+    """Memoized scores for text, or None"""
+    key = (text, backend)
+    with _score_cache_lock:
+        scores = _score_cache.get(key)
+        if scores is not None:
+            _score_cache.move_to_end(key)
+        return scores
+
+
+def _memo_put(text: str, backend: str, scores: Dict[str, float]):
+    """Remember scores for text, evicting the least recently used entry"""
+    with _score_cache_lock:
+        _score_cache[(text, backend)] = scores
+        _score_cache.move_to_end((text, backend))
+        if len(_score_cache) > _SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+
+
+def _cached_scores(text: str, backend: str = DEFAULT_BACKEND) -> Dict[str, float]:
+    """Memoized VADER scores; chat streams repeat short texts ("ok", "lol") a lot"""
+    scores = _memo_get(text, backend)
+    if scores is None:
+        scores = dict(_get_analyzer(backend).polarity_scores(text))
+        _memo_put(text, backend, scores)
+    return scores
+
+
+# Below this many texts a process pool costs more than it saves
+PARALLEL_MIN_TEXTS = 1000
+
+# Texts are truncated to this many characters before scoring; VADER's cost
+# grows with length and sentiment is settled well before this
+MAX_LEN = 4096
+
+# Scores for empty or whitespace-only text (handed out as copies)
+NEUTRAL_SCORES = {'pos': 0.0, 'neg': 0.0, 'neu': 1.0, 'compound': 0.0}
+
+
+def _score_chunk(texts: List[str], backend: str = DEFAULT_BACKEND) -> List[Dict[str, float]]:
+    """Polarity scores for already stripped, truncated texts (pool worker)"""
+    polarity_scores = _get_analyzer(backend).polarity_scores
+    return [dict(polarity_scores(text)) for text in texts]
+
+
+# (backend, n_workers) -> process pool, kept for the life of the process
+_pools: Dict[Tuple[str, int], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(backend: str, n_workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared scoring pool for backend/n_workers, creating it on first use.
+
+    Workers are spawned rather than forked (callers are often threaded) and
+    load the lexicon once, when they start.
+    """
+    key = (backend, n_workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_get_analyzer,
+                initargs=(backend,)
+            )
+        return pool
+
+
+def _discard_pool(backend: str, n_workers: int, pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next batch starts a fresh one"""
+    with _pools_lock:
+        if _pools.get((backend, n_workers)) is pool:
+            del _pools[(backend, n_workers)]
+    pool.shutdown(wait=False)
+
 
 class SentimentAnalyzer:
     """
@@ -53,7 +190,8 @@ class SentimentAnalyzer:
     def __init__(
         self,
         positive_threshold: float = 0.05,
-        negative_threshold: float = -0.05
+        negative_threshold: float = -0.05,
+        backend: str = 'auto'
     ):
         """
         Initialize sentiment analyzer.
@@ -61,8 +199,15 @@ class SentimentAnalyzer:
         Args:
             positive_threshold: Minimum compound score for positive sentiment
             negative_threshold: Maximum compound score for negative sentiment
+            backend: 'python' (vaderSentiment), 'rust' (rust-vader) or
+                'auto' (rust-vader when installed)
+
+        Raises:
+            ImportError: If backend='rust' and rust-vader isn't installed
+            ValueError: If backend is unknown
         """
-        self.analyzer = SentimentIntensityAnalyzer()
+        self.backend = _resolve_backend(backend)
+        self.analyzer = _get_analyzer(self.backend)
         self.positive_threshold = positive_threshold
         self.negative_threshold = negative_threshold
 
@@ -80,37 +225,98 @@ class SentimentAnalyzer:
             compound_score: Float from -1 (most negative) to +1 (most positive)
             detailed_scores: Dict with 'pos', 'neg', 'neu', 'compound' scores
         """
-        if not text or not text.strip():
-            return 'neutral', 0.0, {'pos': 0.0, 'neg': 0.0, 'neu': 1.0, 'compound': 0.0}
+        text = text.strip() if text else ''
+        if not text:
+            return 'neutral', 0.0, NEUTRAL_SCORES.copy()
 
-        # Get polarity scores
-        scores = self.analyzer.polarity_scores(text)
+        # Get polarity scores (long texts are cut at MAX_LEN characters)
+        scores = dict(_cached_scores(text[:MAX_LEN], self.backend))
         compound = scores['compound']
 
-        # Classify sentiment
+        return self._classify(compound), compound, scores
+
+    def _classify(self, compound: float) -> str:
+        """Map a compound score to a sentiment label"""
         if compound >= self.positive_threshold:
-            sentiment = 'positive'
+            return 'positive'
         elif compound <= self.negative_threshold:
-            sentiment = 'negative'
-        else:
-            sentiment = 'neutral'
+            return 'negative'
+        return 'neutral'
+
+    def _score_texts(self, texts: List[str], n_workers: int = 1) -> List[Dict[str, float]]:
+        """
+        Polarity scores for each text, in order.
+
+        Memoized texts are answered from the memo. VADER is pure Python and
+        CPU-bound, so when n_workers > 1 and more than PARALLEL_MIN_TEXTS
+        distinct texts miss, they are sharded across a shared process pool;
+        their scores are memoized here in the parent either way.
+        """
+        backend = self.backend
+        results: List[Dict[str, float]] = [None] * len(texts)
+        misses: Dict[str, List[int]] = {}  # text -> positions needing it
+
+        for i, text in enumerate(texts):
+            text = text.strip() if text else ''
+            # Copies, so callers can't modify the cached dicts
+            if not text:
+                results[i] = NEUTRAL_SCORES.copy()
+                continue
+            text = text[:MAX_LEN]
+            scores = _memo_get(text, backend)
+            if scores is not None:
+                results[i] = dict(scores)
+            else:
+                misses.setdefault(text, []).append(i)
+
+        if not misses:
+            return results
+
+        pending = list(misses)
+        scored = None
+        if n_workers > 1 and len(pending) > PARALLEL_MIN_TEXTS:
+            # A few chunks per worker keeps the pool busy if chunks run unevenly
+            n_chunks = n_workers * 4
+            size = -(-len(pending) // n_chunks)
+            chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+            pool = _get_pool(backend, n_workers)
+            try:
+                score_chunk = functools.partial(_score_chunk, backend=backend)
+                scored = [scores for chunk in pool.map(score_chunk, chunks) for scores in chunk]
+            except BrokenProcessPool:
+                logger.warning("Scoring pool died; scoring %d texts in-process", len(pending))
+                _discard_pool(backend, n_workers, pool)
+        if scored is None:
+            scored = _score_chunk(pending, backend)
+
+        for text, scores in zip(pending, scored):
+            _memo_put(text, backend, scores)
+            for i in misses[text]:
+                results[i] = dict(scores)
+        return results
 
-        return sentiment, compound, scores
+    def _score_all(self, texts: List[str], n_workers: int = 1) -> List[Tuple[str, float, Dict[str, float]]]:
+        """Score a batch once: (sentiment, compound, details) per text, in order"""
+        return [
+            (self._classify(scores['compound']), scores['compound'], scores)
+            for scores in self._score_texts(texts, n_workers)
+        ]
 
-    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+    def analyze_batch(self, texts: List[str], n_workers: int = 1) -> List[Dict]:
         """
         Analyze sentiment for multiple texts.
 
         Args:
             texts: List of texts to analyze
+            n_workers: Processes to score with (used for more than
+                PARALLEL_MIN_TEXTS texts)
 
         Returns:
             List of dicts with 'text', 'sentiment', 'score', 'details'
         """
         results = []
 
-        for text in texts:
-            sentiment, score, details = self.analyze(text)
+        for text, (sentiment, score, details) in zip(texts, self._score_all(texts, n_workers)):
             results.append({
                 'text': text,
                 'sentiment': sentiment,
@@ -120,30 +326,33 @@ class SentimentAnalyzer:
 
         return results
 
-    def get_sentiment_distribution(self, texts: List[str]) -> Dict[str, int]:
+    def get_sentiment_distribution(self, texts: List[str], n_workers: int = 1) -> Dict[str, int]:
         """
         Get count of positive/negative/neutral sentiments in a batch.
 
         Args:
             texts: List of texts to analyze
+            n_workers: Processes to score with (used for more than
+                PARALLEL_MIN_TEXTS texts)
 
         Returns:
             Dict with counts: {'positive': int, 'negative': int, 'neutral': int}
         """
         distribution = {'positive': 0, 'negative': 0, 'neutral': 0}
 
-        for text in texts:
-            sentiment, _, _ = self.analyze(text)
+        for sentiment, _, _ in self._score_all(texts, n_workers):
             distribution[sentiment] += 1
 
         return distribution
 
-    def get_average_sentiment(self, texts: List[str]) -> Tuple[float, str]:
+    def get_average_sentiment(self, texts: List[str], n_workers: int = 1) -> Tuple[float, str]:
         """
         Get average sentiment score across texts.
 
         Args:
             texts: List of texts to analyze
+            n_workers: Processes to score with (used for more than
+                PARALLEL_MIN_TEXTS texts)
 
         Returns:
             Tuple of (average_score, overall_sentiment)
@@ -151,21 +360,10 @@ class SentimentAnalyzer:
         if not texts:
             return 0.0, 'neutral'
 
-        total_score = 0.0
-        for text in texts:
-            _, score, _ = self.analyze(text)
-            total_score += score
-
+        total_score = sum(score for _, score, _ in self._score_all(texts, n_workers))
         avg_score = total_score / len(texts)
 
-        if avg_score >= self.positive_threshold:
-            overall_sentiment = 'positive'
-        elif avg_score <= self.negative_threshold:
-            overall_sentiment = 'negative'
-        else:
-            overall_sentiment = 'neutral'
-
-        return avg_score, overall_sentiment
+        return avg_score, self._classify(avg_score)
 
 
 # Simple function-based pattern (from Bluesky dashboard)
@@ -186,9 +384,11 @@ def analyze_sentiment(text: str) -> Tuple[str, float]:
         sentiment, score = analyze_sentiment("I love this!")
         # Returns: ('positive', 0.763)
     """
-    analyzer = SentimentIntensityAnalyzer()
-    scores = analyzer.polarity_scores(text)
-    compound = scores['compound']
+    text = text.strip() if text else ''
+    if not text:
+        return "neutral", 0.0
+
+    compound = _cached_scores(text[:MAX_LEN])['compound']
 
     if compound >= 0.05:
         return "positive", compound